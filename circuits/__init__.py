@@ -24,7 +24,9 @@ from .core import (
     Component,
     Debugger,
     Event,
+    LightEvent,
     Loader,
+    LoopMonitor,
     Manager,
     TimeoutError,
     Timer,
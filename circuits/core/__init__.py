@@ -6,10 +6,11 @@ This package contains the essential core parts of the circuits framework.
 from .bridge import Bridge, ipc
 from .components import BaseComponent, Component
 from .debugger import Debugger
-from .events import Event
+from .events import Event, LightEvent
 from .handlers import handler, reprhandler
 from .loader import Loader
 from .manager import Manager, TimeoutError, sleep
+from .monitor import LoopMonitor
 from .timers import Timer
 from .values import Value
 from .workers import Worker, task
@@ -20,11 +21,13 @@ __all__ = (
     'BaseComponent',
     'Component',
     'Event',
+    'LightEvent',
     'task',
     'Worker',
     'ipc',
     'Bridge',
     'Debugger',
+    'LoopMonitor',
     'Timer',
     'Manager',
     'TimeoutError',
@@ -12,7 +12,7 @@ import traceback
 from pickle import dumps, loads
 
 from .components import BaseComponent
-from .events import Event, exception
+from .events import Event, LightEvent, exception
 from .handlers import handler
 from .values import Value
 
@@ -50,7 +50,7 @@ class Bridge(BaseComponent):
             self._socket.register(self)
 
     def _process_packet(self, eid, obj):
-        if isinstance(obj, Event):
+        if isinstance(obj, (Event, LightEvent)):
             obj.remote = True
             obj.notify = 'value_changed'
             obj.waitingHandlers = 0
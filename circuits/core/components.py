@@ -1,8 +1,9 @@
 """This module defines the BaseComponent and its subclass Component."""
 
 from collections.abc import Callable
-from inspect import getmembers
+from inspect import isfunction
 from itertools import chain
+from operator import itemgetter
 from types import MethodType
 
 from .events import Event, registered, unregistered
@@ -43,6 +44,72 @@ class prepare_unregister(Event):
             component = component.parent
 
 
+class _HandlerTable:
+    """
+    The event handlers and child components of a component class in the
+    order in which they are registered with each new instance.
+
+    :ivar aliases: ``(name, function)`` of the handlers of the direct base
+        classes to be bound as "<base>_<name>".
+    :ivar handlers: ``(name, handler, bind, keys)``. *bind* is ``None``
+        for an alias already bound by ``__new__`` and tells whether the
+        handler must be bound to the instance otherwise. *keys* are the
+        keys of ``Manager._handlers`` to add the handler to or ``None``
+        for a global handler.
+    :ivar components: ``(name, component)`` of class attributes that are
+        components (see Issue #88).
+    :ivar names: the event names handled or ``None`` if any handler
+        handles all events.
+    """
+
+    __slots__ = ('aliases', 'components', 'handlers', 'names')
+
+    def __init__(self, cls):
+        overrides = {k for k, v in cls.__dict__.items() if getattr(v, 'handler', False) and v.override}
+
+        self.aliases = tuple(
+            (f'{base.__name__}_{k}', v)
+            for base in cls.__bases__
+            for k, v in list(base.__dict__.items())
+            if isinstance(v, Callable) and getattr(v, 'handler', False) and k not in overrides
+        )
+
+        members = {name: (name, v, None) for name, v in self.aliases}
+        components = []
+        for name in dir(cls):
+            try:
+                v = getattr(cls, name)
+            except AttributeError:
+                continue
+            if name in members:
+                continue  # shadowed by an alias
+            if getattr(v, 'handler', False) is True:
+                members[name] = (name, v, isfunction(v))
+            elif isinstance(v, BaseComponent):
+                components.append((name, v))
+
+        names = set()
+        handlers = []
+        for name, v, bind in sorted(members.values(), key=itemgetter(0)):
+            if not v.names and v.channel == '*':
+                keys = None
+            else:
+                keys = tuple(v.names) or ('*',)
+            handlers.append((name, v, bind, keys))
+
+            if names is not None and v.names:
+                names.update(v.names)
+            else:
+                names = None
+
+        if names is not None:
+            names.add('prepare_unregister_complete')
+
+        self.handlers = tuple(handlers)
+        self.components = tuple(components)
+        self.names = names
+
+
 class BaseComponent(Manager):
     """
     This is the base class for all components in a circuits based application.
@@ -80,45 +147,85 @@ class BaseComponent(Manager):
     def __new__(cls, *args, **kwargs):
         self = super().__new__(cls)
 
-        handlers = {k: v for k, v in list(cls.__dict__.items()) if getattr(v, 'handler', False)}
-
-        def overridden(x):
-            return x in handlers and handlers[x].override
-
-        for base in cls.__bases__:
-            if issubclass(cls, base):
-                for k, v in list(base.__dict__.items()):
-                    p1 = isinstance(v, Callable)
-                    p2 = getattr(v, 'handler', False)
-                    p3 = overridden(k)
-                    if p1 and p2 and not p3:
-                        name = f'{base.__name__}_{k}'
-                        method = MethodType(v, self)
-                        setattr(self, name, method)
+        # Handlers of the direct base classes are also available under the
+        # name "<base>_<name>", unless overridden (see handler(override=...))
+        for name, f in cls._handlerTable().aliases:
+            setattr(self, name, MethodType(f, self))
 
         return self
 
     def __init__(self, *args, **kwargs):
         """Initializes x; see x.__class__.__doc__ for signature"""
+        table = self._handlerTable()
+        attrs = self.__dict__
+        components = [(k, v) for k, v in attrs.items() if isinstance(v, BaseComponent)]
+
+        # Attributes set on the instance (e.g. by a subclass before calling
+        # this) shadow those of the class, and are registered if handlers.
+        aliases = {name for name, _ in table.aliases}
+        shadowing = {k for k in attrs if k not in aliases}
+        own_handlers = [v for k, v in attrs.items() if k in shadowing and getattr(v, 'handler', False) is True]
+
         super().__init__(*args, **kwargs)
 
         self.channel = kwargs.get('channel', self.channel) or '*'
 
-        for _k, v in getmembers(self):
-            if getattr(v, 'handler', False) is True:
-                self.addHandler(v)
-            # TODO: Document this feature. See Issue #88
-            if v is not self and isinstance(v, BaseComponent) and v not in ('parent', 'root'):
-                v.register(self)
+        handlers = self._handlers
+        for name, f, bind, keys in table.handlers:
+            if bind is None:
+                method = attrs[name]
+            elif name in shadowing:
+                continue
+            else:
+                method = MethodType(f, self) if bind else f
+            setattr(self, f.__name__, method)
+            if keys is None:
+                self._globals.add(method)
+            else:
+                for key in keys:
+                    handlers.setdefault(key, set()).add(method)
+
+        for f in own_handlers:
+            self._bindHandler(MethodType(f, self) if isfunction(f) else f)
+
+        def _on_prepare_unregister_complete(self, event, e, value):
+            self._do_prepare_unregister_complete(event.parent, value)
+
+        # Spare handler() inspecting the signature for every instance
+        _on_prepare_unregister_complete.event = True
+        f = handler('prepare_unregister_complete', channel=self)(_on_prepare_unregister_complete)
+        self._bindHandler(MethodType(f, self))
+
+        self._invalidateCache(None if own_handlers else table.names)
+
+        # TODO: Document this feature. See Issue #88
+        if components:
+            components.extend(item for item in table.components if item[0] not in attrs)
+            components.sort(key=itemgetter(0))
+        else:
+            components = table.components
+        for _k, v in components:
+            v.register(self)
 
         if hasattr(self, 'init') and isinstance(self.init, Callable):
             self.init(*args, **kwargs)
 
-        @handler('prepare_unregister_complete', channel=self)
-        def _on_prepare_unregister_complete(self, event, e, value):
-            self._do_prepare_unregister_complete(event.parent, value)
+    @classmethod
+    def _handlerTable(cls):
+        """
+        Return the handlers and child components declared by this class.
 
-        self.addHandler(_on_prepare_unregister_complete)
+        The table is built when the first instance of a class is created and
+        reused for all further instances, so that creating a component only
+        has to bind the handlers to the new instance. Handlers added to the
+        class later are therefore not bound to new instances, add them to
+        the instances with :meth:`~.manager.Manager.addHandler` instead.
+        """
+        table = cls.__dict__.get('_handler_table')
+        if table is None:
+            table = _HandlerTable(cls)
+            cls._handler_table = table
+        return table
 
     def register(self, parent):
         """
@@ -165,7 +272,7 @@ class BaseComponent(Manager):
 
         # tick shouldn't be called anymore, although component is still in tree
         self._unregister_pending = True
-        self.root._cache_needs_refresh = True
+        self.root._invalidateCache(self._handlerNames())
 
         # Give components a chance to prepare for unregister
         evt = prepare_unregister(self)
@@ -2,6 +2,42 @@
 
 from inspect import ismethod
 from traceback import format_tb
+from types import MappingProxyType
+
+
+EVENT_CLASS_CACHE_SIZE = 4096
+"""
+Maximum number of dynamically created event classes remembered by
+:meth:`Event.create` and :meth:`Event.child`. Event names may be derived
+from external input (HTTP paths, node protocol messages), so the registry
+is bounded and the oldest entries are evicted first.
+"""
+
+_event_classes = {}
+_child_event_classes = {}
+_no_kwargs = MappingProxyType({})
+
+
+def _remember(registry, key, cls):
+    if len(registry) >= EVENT_CLASS_CACHE_SIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        registry.pop(next(iter(registry), None), None)
+    registry[key] = cls
+    return cls
+
+
+def _event_class(base, name):
+    """
+    Return the subclass of *base* named *name*, creating it on first use.
+
+    Interning these classes keeps ``isinstance`` checks and the manager's
+    handler cache stable and avoids creating (and garbage collecting) a new
+    class for every dynamically named event.
+    """
+    try:
+        return _event_classes[(base, name)]
+    except KeyError:
+        return _remember(_event_classes, (base, name), type(base)(name, (base,), {}))
 
 
 class Event:
@@ -15,13 +51,23 @@ class Event:
     complete = False
     alert_done = False
     waitingHandlers = 0
+    coalesce = None
+    origin = None
+
+    _value = None
+    _fired_by = None
 
     @classmethod
     def create(cls, _name, *args, **kwargs):
-        return type(cls)(_name, (cls,), {})(*args, **kwargs)
+        return _event_class(cls, _name)(*args, **kwargs)
 
     def child(self, name, *args, **kwargs):
-        e = Event.create(f'{self.name:s}_{name:s}', *args, **kwargs)
+        key = (self.name, name)
+        try:
+            cls = _child_event_classes[key]
+        except KeyError:
+            cls = _remember(_child_event_classes, key, _event_class(Event, f'{self.name:s}_{name:s}'))
+        e = cls(*args, **kwargs)
         e.parent = self
         return e
 
@@ -74,12 +120,24 @@ class Event:
             to same channels as the initially dispatched event itself.
             This may be overridden by specifying an alternative list of
             destinations using this attribute.
+
+        :cvar coalesce: an optional method returning a (hashable) key for
+            the event. An event fired while an event of the same name
+            with the same key is queued for the same channels is not
+            queued again, firing it returns the Value of the pending
+            event. This is meant for events that are idempotent while
+            queued, such as requests to refresh some state.
+
+        :cvar origin: an optional method returning a (hashable) key for
+            the source of the event within the component that fires it,
+            e.g. the connection some data was read from. Fair scheduling
+            (see :meth:`~.manager.Manager.setFairScheduling`) takes turns
+            between the sources of a component.
         """
         self.args = list(args)
         self.kwargs = kwargs
 
         self.uid = None
-        self.value = None
         self.handler = None
         self.stopped = False
         self.cancelled = False
@@ -89,8 +147,29 @@ class Event:
     def __getstate__(self):
         odict = self.__dict__.copy()
         del odict['handler']
+        odict.pop('_fired_by', None)
         return odict
 
+    @property
+    def value(self):
+        """
+        The :class:`~circuits.core.values.Value` holding the results of the
+        handlers invoked for this event or ``None`` if it was not fired yet.
+
+        The Value of an event fired without one (``Manager._fireEvent``)
+        is created here once it is needed.
+        """
+        value = self._value
+        if value is None and self._fired_by is not None:
+            from .values import Value
+
+            value = self._value = Value(self, self._fired_by)
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
     def __setstate__(self, dict):
         self.__dict__.update(dict)
 
@@ -158,6 +237,94 @@ class Event:
         self.stopped = True
 
 
+class LightEvent:
+    """
+    A compact event for high volume events such as I/O events.
+
+    A LightEvent behaves like an :class:`Event` but keeps its state in
+    ``__slots__`` instead of a ``__dict__``: :attr:`args` is kept as the
+    tuple passed to the constructor and the keyword arguments are shared
+    (and read-only) if there are none. Only the attributes maintained by
+    the manager, :attr:`notify` and ``remote`` (set by the
+    :class:`~circuits.core.bridge.Bridge`) can be set on instances;
+    ``success``, ``failure`` and ``complete`` may be set as class
+    attributes but ``channels`` can't have a class default. Subclasses must declare
+    ``__slots__ = ()`` to remain compact, those that don't get a
+    ``__dict__`` and accept any attribute again.
+
+    Note that LightEvent is not a subclass of :class:`Event`.
+    """
+
+    __slots__ = (
+        'args',
+        'kwargs',
+        'channels',
+        'handler',
+        'notify',
+        'stopped',
+        'cancelled',
+        'alert_done',
+        'waitingHandlers',
+        'cause',
+        'effects',
+        'remote',
+        '_value',
+        '_fired_by',
+    )
+
+    parent = None
+    success = False
+    failure = False
+    complete = False
+    coalesce = None
+    origin = None
+
+    create = Event.__dict__['create']
+    child = Event.child
+    value = Event.value
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'name' not in cls.__dict__:
+            cls.name = cls.__name__
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs or _no_kwargs
+        self.channels = ()
+        self.handler = None
+        self.notify = False
+        self.stopped = False
+        self.cancelled = False
+        self.alert_done = False
+        self.waitingHandlers = 0
+        self.remote = False
+        self._value = None
+        self._fired_by = None
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', ()))
+        for name in LightEvent.__slots__:
+            if name not in ('handler', '_fired_by') and hasattr(self, name):
+                state[name] = getattr(self, name)
+        state['kwargs'] = dict(self.kwargs)
+        return state
+
+    def __setstate__(self, state):
+        LightEvent.__init__(self)
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.kwargs = self.kwargs or _no_kwargs
+
+    __le__ = Event.__le__
+    __gt__ = Event.__gt__
+    __repr__ = Event.__repr__
+    __getitem__ = Event.__getitem__
+    __setitem__ = Event.__setitem__
+    cancel = Event.cancel
+    stop = Event.stop
+
+
 class exception(Event):
     """
     exception Event
@@ -261,7 +428,40 @@ class unregistered(Event):
     """
 
 
-class generate_events(Event):
+class queue_pressure(Event):
+    """
+    queue_pressure Event
+
+    This Event is sent by the circuits core when the root manager's event
+    queue has grown to its high watermark (see
+    :meth:`~.manager.Manager.setQueueLimits`). Pollers stop reading until
+    the matching :class:`queue_relief` Event is sent.
+
+    :param queued: The number of queued events
+    :type  queued: int
+    """
+
+    def __init__(self, queued):
+        super().__init__(queued)
+
+
+class queue_relief(Event):
+    """
+    queue_relief Event
+
+    This Event is sent by the circuits core when the root manager's event
+    queue has drained to its low watermark after a :class:`queue_pressure`
+    Event.
+
+    :param queued: The number of queued events
+    :type  queued: int
+    """
+
+    def __init__(self, queued):
+        super().__init__(queued)
+
+
+class generate_events(LightEvent):
     """
     generate_events Event
 
@@ -282,6 +482,8 @@ class generate_events(Event):
     that interrupts waiting for events.
     """
 
+    __slots__ = ('_time_left', '_lock')
+
     def __init__(self, lock, max_wait):
         super().__init__()
 
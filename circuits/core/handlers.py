@@ -60,6 +60,13 @@ def handler(*names, **kwargs):
     attribute. For the simplest scenario, there even is a utility
     method :meth:`circuits.core.manager.Manager.callEvent` that combines
     firing and waiting.
+
+    A handler may also be defined with ``async def``. Its coroutine is run
+    as a task as well and may ``await`` :meth:`~.manager.Manager.callEvent`,
+    :meth:`~.manager.Manager.waitEvent`, :func:`~.manager.sleep` or the
+    :class:`~.values.Value` returned by :meth:`~.manager.Manager.fireEvent`.
+    It is suspended until what it awaits is done, and the value it returns
+    becomes the handler's result.
     """
 
     def wrapper(f):
@@ -74,11 +81,12 @@ def handler(*names, **kwargs):
         f.channel = kwargs.get('channel', None)
         f.override = kwargs.get('override', False)
 
-        args = getargspec(f)[0]
+        if not hasattr(f, 'event'):
+            args = getargspec(f)[0]
 
-        if args and args[0] == 'self':
-            del args[0]
-        f.event = getattr(f, 'event', bool(args and args[0] == 'event'))
+            if args and args[0] == 'self':
+                del args[0]
+            f.event = bool(args and args[0] == 'event')
 
         return f
 
@@ -0,0 +1,153 @@
+"""
+This module defines the Instrumentation of a Manager.
+
+The instrumentation records the wall time spent in each handler and the
+time events wait in the queue. It is enabled with
+:meth:`~circuits.core.manager.Manager.setInstrumentation`.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+
+BOUNDS = tuple(round(m * 10.0**e, 6) for e in range(-5, 1) for m in (1, 2.5, 5)) + (10.0,)
+"""
+Upper bounds (in seconds) of the buckets of a :class:`Histogram`, the
+last bucket takes all longer durations.
+"""
+
+MAX_STAMPS = 4096
+"""
+The maximum number of queued events whose queue wait is being measured,
+when exceeded the oldest are forgotten (e.g. events that are never
+dispatched as their manager has stopped).
+"""
+
+
+class Histogram:
+    """
+    Durations recorded in buckets of logarithmic size (see :data:`BOUNDS`).
+
+    :ivar calls: the number of durations recorded.
+    :ivar total: the sum of the durations.
+    :ivar max: the longest duration.
+    :ivar counts: the number of durations by bucket.
+    """
+
+    __slots__ = ('calls', 'counts', 'max', 'total')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.counts = [0] * (len(BOUNDS) + 1)
+
+    def __repr__(self):
+        return f'<Histogram ({self.calls} calls, {self.total:0.6f}s, max {self.max:0.6f}s)>'
+
+    def add(self, duration):
+        self.calls += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.counts[bisect_left(BOUNDS, duration)] += 1
+
+    @property
+    def mean(self):
+        return self.total / self.calls if self.calls else 0.0
+
+    def percentile(self, p):
+        """
+        Return an upper bound of the *p*-th percentile of the recorded
+        durations: the bound of the bucket it falls into, or :attr:`max`
+        if that is smaller.
+        """
+        rank = p / 100.0 * self.calls
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(BOUNDS[i], self.max) if i < len(BOUNDS) else self.max
+        return 0.0
+
+
+class Instrumentation:
+    """
+    Instrumentation(sample=1) -> new Instrumentation
+
+    Records a :class:`Histogram` of the wall time of every handler by
+    event name and handler name in :attr:`handlers`, and of the time
+    events have been queued by event name in :attr:`queue_wait`. The
+    steps of generator and coroutine handlers (including the generators
+    they delegate to) count as calls of the handler.
+
+    To reduce the overhead, only one in *sample* events is recorded.
+    """
+
+    def __init__(self, sample=1):
+        if sample < 1:
+            raise ValueError('The sample rate must be at least 1')
+
+        self.sample = sample
+        self.handlers = defaultdict(Histogram)
+        self.queue_wait = defaultdict(Histogram)
+
+        self._fired = 0
+        self._dispatched = 0
+        self._stamps = {}
+        self._owners = WeakKeyDictionary()
+
+    def __repr__(self):
+        return f'<Instrumentation (1/{self.sample}, {len(self.handlers)} handlers)>'
+
+    def reset(self):
+        """Discard the recorded data"""
+        self.handlers.clear()
+        self.queue_wait.clear()
+
+    def fired(self, event):
+        # Events that may be coalesced are left out, as they may never
+        # be dispatched.
+        self._fired += 1
+        if self._fired >= self.sample and event.coalesce is None:
+            self._fired = 0
+            stamps = self._stamps
+            if len(stamps) >= MAX_STAMPS:
+                del stamps[next(iter(stamps))]
+            stamps[event] = perf_counter()
+
+    def dispatching(self, event):
+        """
+        Record the queue wait of *event* and return True if its handlers
+        are to be timed.
+        """
+        if self._stamps:
+            stamp = self._stamps.pop(event, None)
+            if stamp is not None:
+                self.queue_wait[event.name].add(perf_counter() - stamp)
+
+        self._dispatched += 1
+        if self._dispatched >= self.sample:
+            self._dispatched = 0
+            return True
+        return False
+
+    def started(self, task, handler):
+        """
+        Remember *handler* as the owner of the generator or coroutine
+        *task* it returned when it was timed.
+        """
+        self._owners[task] = handler
+
+    def owner(self, task):
+        """
+        Return the handler owning *task* (see :meth:`started`), or None
+        if its steps are not to be timed.
+        """
+        return self._owners.get(task)
+
+    def record(self, event, handler, duration):
+        name = getattr(handler, '__qualname__', None) or repr(handler)
+        self.handlers[(event.name, name)].add(duration)
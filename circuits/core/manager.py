@@ -4,23 +4,25 @@ import _thread
 import atexit
 import contextlib
 import types
-from collections import deque
-from heapq import heappop, heappush
+from bisect import insort
+from collections import Counter, deque
+from heapq import heapify, heappop, heappush
 from inspect import isfunction
-from itertools import chain
+from itertools import chain, count, zip_longest
 from multiprocessing import Process, current_process
 from operator import attrgetter
 from os import getpid, kill
+from queue import Full
 from signal import SIGINT, SIGTERM, signal as set_signal_handler
 from sys import exc_info as _exc_info, stderr
-from threading import RLock, Thread, current_thread
-from time import time
+from threading import Condition, RLock, Thread, current_thread
+from time import perf_counter, time
 from traceback import format_exc
-from types import GeneratorType
+from types import CoroutineType, GeneratorType, coroutine
 from uuid import uuid4 as uuid
 
-from .events import Event, exception, generate_events, signal, started, stopped
-from .handlers import handler
+from .events import Event, LightEvent, exception, generate_events, queue_pressure, queue_relief, signal, started, stopped
+from .instrument import Instrumentation
 from .values import Value
 
 
@@ -74,6 +76,9 @@ class Sleep:
             raise StopIteration()
         return self
 
+    def __await__(self):
+        yield self
+
     @property
     def expired(self):
         return time() >= self.expiry
@@ -91,70 +96,284 @@ def sleep(seconds):
     """
     Delay execution of a coroutine for a given number of seconds.
     The argument may be a floating point number for subsecond precision.
+
+    Use ``yield sleep(seconds)`` in a generator based handler and
+    ``await sleep(seconds)`` in an ``async def`` handler.
     """
     return Sleep(seconds)
 
 
-class Dummy:
-    channel = None
+class TimerHandle:
+    """
+    A call scheduled with :meth:`Manager.scheduleTimer`.
+
+    :ivar expiry: the time the call is due.
+    """
+
+    __slots__ = ('args', 'callback', 'expiry', 'manager')
+
+    def __init__(self, manager, expiry, callback, args):
+        self.manager = manager
+        self.expiry = expiry
+        self.callback = callback
+        self.args = args
+
+    def __repr__(self):
+        state = 'pending' if self.callback is not None else 'done'
+        return f'<TimerHandle ({self.expiry - time():0.3f}s) [{state}]>'
+
+    @property
+    def pending(self):
+        return self.callback is not None
+
+    def cancel(self):
+        """Cancel the call if it has not been made yet"""
+        if self.callback is not None:
+            self.callback = None
+            self.args = ()
+            with self.manager._lock:
+                self.manager._timers_cancelled += 1
 
 
-_dummy = Dummy()
-del Dummy
+_OWN_CHANNEL = object()
+"""Index key of handlers listening on the channel of their manager"""
 
 
 class _State:
-    __slots__ = ('event', 'flag', 'parent', 'run', 'task', 'task_event', 'tick_handler', 'timeout')
+    __slots__ = ('error', 'event', 'flag', 'parent', 'task', 'task_event', 'timeout', 'value')
 
-    def __init__(self, timeout):
+    def __init__(self, timeout=-1):
         self.task = None
-        self.run = False
         self.flag = False
         self.event = None
         self.timeout = timeout
         self.parent = None
         self.task_event = None
-        self.tick_handler = None
+        self.value = None
+        self.error = None
+
+
+class _Waiter(_State):
+    """
+    A task suspended in :meth:`Manager.waitEvent`.
+
+    Waiters are kept in a registry of the root manager instead of being
+    registered as event handlers, so waiting leaves the dispatch cache alone.
+    """
+
+    __slots__ = ('channels', 'manager', 'name', 'target', 'timer')
+
+    def __init__(self, manager, name, target, channels, timeout=-1):
+        super().__init__(timeout)
+        self.manager = manager
+        self.name = name
+        self.target = target
+        self.channels = channels
+        self.timer = None
+
+    def matches(self, event, channels):
+        """Same channel matching as :meth:`Manager.getHandlers`"""
+        if self.target is not None and event is not self.target:
+            return False
+
+        manager = self.manager
+        for waiter_channel in self.channels:
+            if waiter_channel is None:
+                waiter_channel = getattr(manager, 'channel', None)
+            for channel in channels:
+                if channel == '*' or waiter_channel in ('*', channel) or channel is manager:
+                    return True
+        return False
+
+
+def _suspend(state):
+    """
+    Suspend the task yielding this generator until it is resumed with
+    :meth:`Manager._resumeTask` for the given *state*. The task then
+    receives the value (or has the error raised) that was passed to
+    :meth:`Manager._resumeTask`.
+    """
+    yield state
+
+    if state.error is not None:
+        yield ExceptionWrapper(state.error)
+    else:
+        yield CallValue(state.value)
 
 
 class _EventQueue:
-    __slots__ = ('_counter', '_flush_batch', '_priority_queue', '_queue')
+    """
+    The event queue maintained by a root manager.
+
+    Events are appended to an inbound FIFO. When a flush starts, the events
+    queued so far form the flush batch and are moved into FIFO buckets, one
+    per priority. The batch is dispatched starting with the bucket of the
+    lowest priority value, preserving the order of arrival within a bucket.
+    Events fired while a batch is being dispatched wait for the next flush.
+
+    As almost all events share the default priority, enqueueing and
+    dequeueing are O(1) in the common case.
+
+    Events with a :attr:`~.events.Event.coalesce` method are remembered by
+    their key until their flush starts, an equal event appended meanwhile
+    is dropped and counted in :attr:`coalesced`.
+
+    If :attr:`fair` is set, the events of a priority are not dispatched in
+    order of arrival but taking turns between their origins, the firing
+    component and channels and the :attr:`~.events.Event.origin` of the
+    event, e.g. the connection of a server. If :attr:`budget` is set as well, an origin
+    gets at most that many events into a flush batch, the others are put
+    back to the head of the queue for the next flush.
+    """
+
+    __slots__ = ('_buckets', '_flush_batch', '_pending', '_priorities', '_queue', 'budget', 'coalesced', 'fair')
 
     def __init__(self):
         self._queue = deque()
-        self._priority_queue = []
-        self._counter = -1
+        self._buckets = {}
+        self._priorities = []
         self._flush_batch = 0
+        self._pending = {}
+        self.coalesced = Counter()
+        self.fair = False
+        self.budget = None
 
     def __len__(self):
-        return len(self._queue) + len(self._priority_queue)
+        return len(self._queue) + self._flush_batch
 
     def drainFrom(self, other_queue):
         self._queue.extend(other_queue._queue)
         other_queue._queue.clear()
         # Queue is currently flushing events /o\
-        assert not len(other_queue._priority_queue)
+        assert not other_queue._flush_batch
 
     def append(self, event, channel, priority):
-        self._counter += 1
-        self._queue.append((priority, self._counter, (event, channel)))
+        if event.coalesce is not None and self._coalesce(event, channel):
+            return
+        self._queue.append((priority, event, channel))
+
+    def extend(self, events, priority):
+        if any(event.coalesce is not None for event, _ in events):
+            for event, channel in events:
+                self.append(event, channel, priority)
+        else:
+            self._queue.extend([(priority, event, channel) for event, channel in events])
+
+    def _coalesce(self, event, channel):
+        # Returns True if *event* equals a pending event. Events counted
+        # as effects of another event (see Event.complete) are kept.
+        if getattr(event, 'cause', None) is not None:
+            return False
+        key = (event.name, channel, event.coalesce())
+        pending = self._pending.setdefault(key, event)
+        if pending is event:
+            return False
+
+        self.coalesced[event.name] += 1
+        if event._value is not None:
+            event.value = pending.value
+        return True
+
+    def _startBatch(self):
+        if self.fair:
+            return self._startFairBatch()
+
+        # Only move as many events as are queued right now, others may
+        # be appended concurrently by other threads.
+        buckets = self._buckets
+        popleft = self._queue.popleft
+        count = batch = len(self._queue)
+        while count:
+            count -= 1
+            item = popleft()
+            try:
+                buckets[item[0]].append(item)
+            except KeyError:
+                buckets[item[0]] = deque((item,))
+                insort(self._priorities, item[0])
+        self._flush_batch = batch
+        # Events appended from now on aren't dropped for an event of
+        # the batch, whose handlers may already have run.
+        if self._pending:
+            self._pending.clear()
+        return None
+
+    def _startFairBatch(self):
+        budget = self.budget
+        popleft = self._queue.popleft
+        origins = {}
+        taken = Counter()
+        deferred = []
+        count = len(self._queue)
+        while count:
+            count -= 1
+            item = popleft()
+            _, event, channels = item
+            origin = (event._fired_by, channels, None if event.origin is None else event.origin())
+            if budget is not None and taken[origin] >= budget and not isinstance(event, generate_events):
+                deferred.append(item)
+                continue
+            taken[origin] += 1
+            origins.setdefault(item[0], {}).setdefault(origin, []).append(item)
+
+        # Deferred events go first next time, before events appended
+        # concurrently by other threads.
+        self._queue.extendleft(reversed(deferred))
+
+        for priority, queues in origins.items():
+            turns = zip_longest(*queues.values())
+            self._buckets[priority] = deque(item for turn in turns for item in turn if item is not None)
+            insort(self._priorities, priority)
+        self._flush_batch = sum(taken.values())
+        if self._pending:
+            self._pending.clear()
 
     def dispatchEvents(self, dispatcher):
         if self._flush_batch == 0:
-            # FIXME: Might be faster to use heapify instead of pop +
-            # heappush. Though, with regards to thread safety this
-            # appears to be the better approach.
-            self._flush_batch = count = len(self._queue)
-            while count:
-                count -= 1
-                heappush(self._priority_queue, self._queue.popleft())
+            self._startBatch()
 
+        buckets = self._buckets
+        priorities = self._priorities
         while self._flush_batch > 0:
             self._flush_batch -= 1  # Decrement first!
-            (event, channels) = heappop(self._priority_queue)[2]
+            priority = priorities[0]
+            bucket = buckets[priority]
+            _, event, channels = bucket.popleft()
+            if not bucket:
+                del buckets[priority]
+                del priorities[0]
             dispatcher(event, channels, self._flush_batch)
 
 
+class _DispatchPlan:
+    """
+    The handlers of an event name and channels in invocation order, with
+    what the dispatcher would otherwise look up for every event.
+
+    :ivar handlers: ``(handler, pass_event)`` pairs in invocation order,
+        *pass_event* telling whether the handler expects the event object
+        as its first argument.
+    :ivar generate_events: True if this plan dispatches a
+        :class:`~.events.generate_events` event, which needs extra care
+        regarding the time left for waiting.
+    :ivar plain: True if the handlers may be run by the dispatcher's
+        plain loop, which skips the per handler bookkeeping of ticking and
+        timed events. The plain loop is only used for events that need no
+        feedback (success, failure, complete, waiters) either, which is
+        checked per event as these may be set on the event instance.
+    """
+
+    __slots__ = ('generate_events', 'handlers', 'plain')
+
+    def __init__(self, handlers, generate_events=False):
+        self.handlers = tuple((handler, handler.event) for handler in handlers)
+        self.generate_events = generate_events
+        self.plain = not generate_events
+
+    def __len__(self):
+        return len(self.handlers)
+
+
 class Manager:
     """
     The manager class has two roles. As a base class for component
@@ -209,17 +428,39 @@ class Manager:
     The event currently being handled.
     """
 
+    _waiting_in_loop = False
+    """
+    Set by a poller whose event loop runs callbacks in the main thread
+    while waiting for I/O, events fired by them must cut the wait short.
+    """
+
+    _instrument = None
+    _monitor = None
+
+    _queue_high = _queue_low = _queue_overflow = None
+    _queue_pressure = False
+    _queue_consumer = None
+    _queue_cond = None
+
     def __init__(self, *args, **kwargs):
         """Initializes x; see x.__class__.__doc__ for signature"""
         self._queue = _EventQueue()
 
-        self._tasks = set()
+        self._tasks = {}
+        self._tasks_woken = False
+        self._timers = []
+        self._timers_order = count()
+        self._timers_cancelled = 0
+        self._waiters = {}
+        self._waiters_done = {}
         self._cache = {}
         self._globals = set()
         self._handlers = {}
+        self._handlers_by_channel = {}
 
         self._flush_batch = 0
         self._cache_needs_refresh = False
+        self._cache_invalid = set()
 
         self._executing_thread = None
         self._flushing_thread = None
@@ -334,64 +575,98 @@ class Manager:
         """Return the running state of this Component/Manager"""
         return self._running
 
+    @property
+    def coalesced(self):
+        """
+        Return the number of events, by name, that were not queued
+        because an equal event was pending (see :attr:`~.events.Event.coalesce`)
+        """
+        return self.root._queue.coalesced
+
     @property
     def pid(self):
         """Return the process id of this Component/Manager"""
         return getpid() if self.__process is None else self.__process.pid
 
     def getHandlers(self, event, channel, **kwargs):
-        name = event.name
         handlers = set()
+        self._collectHandlers(('*', event.name), channel, handlers, not kwargs.get('exclude_globals', False))
+        return handlers
+
+    def _collectHandlers(self, names, channel, handlers, include_globals):
+        # Add the handlers of this manager and its children to *handlers*
+        for name in names:
+            by_channel = self._handlers_by_channel.get(name)
+            if by_channel is None:
+                if name not in self._handlers:
+                    continue
+                by_channel = self._indexHandlers(name)
+
+            if channel == '*' or channel is self:
+                for _handlers in by_channel.values():
+                    handlers.update(_handlers)
+                continue
+
+            for handler_channel in ('*', channel):
+                if handler_channel in by_channel:
+                    handlers.update(by_channel[handler_channel])
+            if _OWN_CHANNEL in by_channel and getattr(self, 'channel', None) in ('*', channel):
+                handlers.update(by_channel[_OWN_CHANNEL])
+
+        if include_globals and self._globals:
+            handlers.update(self._globals)
 
-        _handlers = set()
-        _handlers.update(self._handlers.get('*', []))
-        _handlers.update(self._handlers.get(name, []))
+        if self.components:
+            for c in self.components.copy():
+                c._collectHandlers(names, channel, handlers, include_globals)
 
-        for _handler in _handlers:
+    def _indexHandlers(self, name):
+        """
+        Index the handlers of the given event name by channel. Handlers
+        without a channel of their own listen on the channel of the
+        component they are bound to; those bound to this manager are
+        indexed under ``_OWN_CHANNEL`` so that the index remains valid
+        if the channel of this manager changes.
+        """
+        by_channel = {}
+        for _handler in self._handlers[name]:
             handler_channel = _handler.channel
             if handler_channel is None:
-                # TODO: Why do we care about the event handler's channel?
-                #      This probably costs us performance for what?
-                #      I've not ever had to rely on this in practice...
-                handler_channel = getattr(
-                    getattr(_handler, 'im_self', getattr(_handler, '__self__', _dummy)),
-                    'channel',
-                    None,
-                )
-
-            if channel == '*' or handler_channel in ('*', channel) or channel is self:
-                handlers.add(_handler)
-
-        if not kwargs.get('exclude_globals', False):
-            handlers.update(self._globals)
+                owner = getattr(_handler, '__self__', None)
+                handler_channel = _OWN_CHANNEL if owner is self else getattr(owner, 'channel', None)
+            by_channel.setdefault(handler_channel, set()).add(_handler)
 
-        for c in self.components.copy():
-            handlers.update(c.getHandlers(event, channel, **kwargs))
-
-        return handlers
+        self._handlers_by_channel[name] = by_channel
+        return by_channel
 
     def addHandler(self, f):
         method = types.MethodType(f, self) if isfunction(f) else f
 
+        self._bindHandler(method)
+        self.root._invalidateCache(method.names or None)
+
+        return method
+
+    def _bindHandler(self, method):
+        # Like addHandler() but leaves the cache to the caller
         setattr(self, method.__name__, method)
 
         if not method.names and method.channel == '*':
             self._globals.add(method)
         elif not method.names:
             self._handlers.setdefault('*', set()).add(method)
+            self._handlers_by_channel.pop('*', None)
         else:
             for name in method.names:
                 self._handlers.setdefault(name, set()).add(method)
-
-        self.root._cache_needs_refresh = True
-
-        return method
+                self._handlers_by_channel.pop(name, None)
 
     def removeHandler(self, method, event=None):
         names = method.names if event is None else [event]
 
         for name in names:
             self._handlers[name].remove(method)
+            self._handlers_by_channel.pop(name, None)
             if not self._handlers[name]:
                 del self._handlers[name]
                 try:
@@ -400,7 +675,7 @@ class Manager:
                     # Handler was never part of self
                     pass
 
-        self.root._cache_needs_refresh = True
+        self.root._invalidateCache(names or None)
 
     def registerChild(self, component):
         if component._executing_thread is not None:
@@ -410,11 +685,55 @@ class Manager:
             component._executing_thread = None
         self.components.add(component)
         self.root._queue.drainFrom(component._queue)
-        self.root._cache_needs_refresh = True
+        self.root._invalidateCache(component._handlerNames())
 
     def unregisterChild(self, component):
         self.components.remove(component)
-        self.root._cache_needs_refresh = True
+        self.root._invalidateCache(component._handlerNames())
+
+    def _handlerNames(self):
+        """
+        Return the names of all events handled by this manager and its
+        children or ``None`` if any of these handlers matches every event.
+        """
+        if self._globals or '*' in self._handlers:
+            return None
+
+        names = set(self._handlers)
+        for c in self.components.copy():
+            child_names = c._handlerNames()
+            if child_names is None:
+                return None
+            names.update(child_names)
+
+        return names
+
+    def _invalidateCache(self, names=None):
+        """
+        Mark the cached handlers for the given event *names* as stale.
+        If *names* is ``None`` the whole cache is dropped.
+
+        The cache itself is only modified by the dispatching thread
+        (see :meth:`_refreshCache`), this merely records what to drop.
+        """
+        with self._lock:
+            if names is None:
+                self._cache_invalid.add(None)
+            else:
+                self._cache_invalid.update(names)
+            self._cache_needs_refresh = True
+
+    def _refreshCache(self):
+        with self._lock:
+            names = self._cache_invalid
+            self._cache_invalid = set()
+            self._cache_needs_refresh = False
+
+        if None in names:
+            self._cache.clear()
+        else:
+            for name in names:
+                self._cache.pop(name, None)
 
     def _fire(self, event, channel, priority=0):
         # check if event is fired while handling an event
@@ -427,7 +746,11 @@ class Manager:
                 event.effects = 1
                 self._currently_handling.effects += 1
 
+            if self._instrument is not None:
+                self._instrument.fired(event)
             self._queue.append(event, channel, priority)
+            if self._waiting_in_loop:
+                self._currently_handling.reduce_time_left(0)
 
         # the event comes from another thread
         else:
@@ -443,12 +766,157 @@ class Manager:
                 # self._currently_handling = None though, but then need to copy
                 # it to a local variable here before performing a sequence of
                 # operations that assume its value to remain unchanged.
+                if self._queue_pressure:
+                    self._waitQueue()
                 handling = self._currently_handling
 
+                if self._instrument is not None:
+                    self._instrument.fired(event)
                 self._queue.append(event, channel, priority)
+                if self._queue_high is not None:
+                    self._checkQueue()
                 if isinstance(handling, generate_events):
                     handling.reduce_time_left(0)
 
+    def _fireMany(self, events, priority=0):
+        # Like _fire() for a sequence of (event, channels) pairs
+        th = self._executing_thread or self._flushing_thread
+        if _thread.get_ident() == (th.ident if th else None):
+            for event, channel in events:
+                self._fire(event, channel, priority)
+            return
+
+        # From another thread, queue all events and wake up the main
+        # loop once (see _fire())
+        with self._lock:
+            if self._queue_pressure:
+                self._waitQueue()
+            handling = self._currently_handling
+
+            if self._instrument is not None:
+                for event, _ in events:
+                    self._instrument.fired(event)
+            self._queue.extend(events, priority)
+            if self._queue_high is not None:
+                self._checkQueue()
+            if isinstance(handling, generate_events):
+                handling.reduce_time_left(0)
+
+    def setQueueLimits(self, high, low=None, overflow=None):
+        """
+        Bound the event queue of this (root) manager.
+
+        When *high* or more events are queued, a
+        :class:`~.events.queue_pressure` event is fired and pollers stop
+        reading new data. When the queue has drained to *low* events,
+        a :class:`~.events.queue_relief` event is fired and reading
+        resumes. The queue is checked once per :meth:`tick` and whenever
+        another thread fires an event.
+
+        :param high: the high watermark, ``None`` removes the limits.
+        :param low: the low watermark, defaults to half of *high*.
+        :param overflow: what :meth:`fire` does when called by another
+            thread while the queue is under pressure: ``None`` queues
+            the event anyway, ``'block'`` waits for the queue to be
+            relieved and ``'raise'`` raises :class:`queue.Full`.
+        """
+        if overflow not in (None, 'block', 'raise'):
+            raise ValueError(f'Invalid overflow behaviour: {overflow!r}')
+        if high is not None:
+            low = high // 2 if low is None else low
+            if not 0 <= low < high:
+                raise ValueError('The low watermark must be below the high watermark')
+
+        root = self.root
+        with root._lock:
+            root._queue_high = high
+            root._queue_low = low
+            root._queue_overflow = overflow
+            if root._queue_cond is None:
+                root._queue_cond = Condition(root._lock)
+            root._checkQueue()
+            handling = root._currently_handling
+            if isinstance(handling, generate_events):
+                handling.reduce_time_left(0)
+
+    def setFairScheduling(self, fair=True, budget=None):
+        """
+        Dispatch the events of a flush of this (root) manager in turns
+        by origin, the component that fired an event, its channels and
+        its :attr:`~.events.Event.origin` (e.g. the connection some data
+        was read from), instead of in order of arrival. Events of different priorities
+        are still dispatched in order of priority.
+
+        :param fair: enables (or disables) fair scheduling.
+        :param budget: the maximum number of events of a single origin
+            dispatched in one flush, the others are left for the next
+            flush. ``None`` means unlimited.
+        """
+        if budget is not None and budget < 1:
+            raise ValueError('The budget must be at least 1')
+
+        root = self.root
+        with root._lock:
+            root._queue.fair = fair
+            root._queue.budget = budget if fair else None
+
+    def setInstrumentation(self, enabled=True, sample=1):
+        """
+        Record the time spent in each handler and the time events wait
+        in the queue of this (root) manager.
+
+        :param enabled: enables (or disables and discards) the recording.
+        :param sample: record only one in *sample* events.
+        :returns: the :class:`~.instrument.Instrumentation` holding the
+            records, also available as :attr:`instrumentation`.
+        """
+        root = self.root
+        root._instrument = Instrumentation(sample) if enabled else None
+        return root._instrument
+
+    @property
+    def instrumentation(self):
+        """
+        Return the :class:`~.instrument.Instrumentation` of the root
+        manager or ``None`` (see :meth:`setInstrumentation`)
+        """
+        return self.root._instrument
+
+    def _checkQueue(self):
+        # Must be called with self._lock held. The events are queued
+        # directly, firing them must not block or recurse.
+        queued = len(self._queue)
+        if not self._queue_pressure:
+            if self._queue_high is None or queued < self._queue_high:
+                return
+            self._queue_pressure = True
+            event = queue_pressure(queued)
+        elif self._queue_high is None or queued <= self._queue_low:
+            self._queue_pressure = False
+            event = queue_relief(queued)
+            self._queue_cond.notify_all()
+        else:
+            return
+
+        event.channels = ('*',)
+        event._fired_by = self
+        self._queue.append(event, event.channels, 0)
+
+    def _waitQueue(self):
+        # Must be called with self._lock held by a thread firing an event
+        # while the queue is under pressure. The thread dispatching the
+        # events must never wait for itself.
+        if self._queue_overflow is None or _thread.get_ident() == self._queue_consumer:
+            return
+        if self._queue_overflow == 'raise':
+            raise Full(f'Event queue is full ({len(self._queue)} events)')
+        while self._queue_pressure and self._running:
+            # Make sure the main loop is not waiting for new events
+            handling = self._currently_handling
+            if isinstance(handling, generate_events):
+                handling.reduce_time_left(0)
+            self._queue_cond.wait()
+
     def fireEvent(self, event, *channels, **kwargs):
         """
         Fire an event into the system.
@@ -462,30 +930,169 @@ class Manager:
            when set neither, the event is delivered on all
            channels ("*").
         """
+        event.value = Value(event, self)
+        self._fireEvent(event, *channels, **kwargs)
+
+        return event.value
+
+    fire = fireEvent
+
+    def _fireEvent(self, event, *channels, **kwargs):
+        # Like fireEvent() but for new events whose Value is of no interest
+        # to the caller, e.g. I/O events. The Value is only created if a
+        # handler needs it (see Event.value).
         if not channels:
             channels = event.channels or (getattr(self, 'channel', '*'),)
 
         event.channels = channels
-
-        event.value = Value(event, self)
+        event._fired_by = self
         self.root._fire(event, channels, **kwargs)
 
-        return event.value
+    def fireEvents(self, events, *channels, **kwargs):
+        """
+        Fire several events into the system at once.
+
+        Every event of *events* is fired as by :meth:`fireEvent`, on
+        *channels* if given. Events fired by another thread than the one
+        running the main loop are queued with a single acquisition of the
+        manager's lock and wake up the main loop only once, which makes
+        this the preferred way to feed a running system with many events.
+
+        Other than :meth:`fireEvent`, this returns nothing. The
+        :class:`~.values.Value` of every event is created before it is
+        queued, as by :meth:`fireEvent`, and is found in the
+        :attr:`~.events.Event.value` of the event.
+        """
+        default = (getattr(self, 'channel', '*'),)
+        batch = []
+        for event in events:
+            event.value = Value(event, self)
+            event.channels = channels or event.channels or default
+            event._fired_by = self
+            batch.append((event, event.channels))
 
-    fire = fireEvent
+        self.root._fireMany(batch, **kwargs)
 
     def registerTask(self, g):
-        self.root._tasks.add(g)
+        """
+        Make the task *g* ready to be resumed by the next :meth:`tick`.
+
+        A task stays registered (and is resumed on every tick) until it
+        suspends itself, e.g. by yielding :func:`sleep` or the result of
+        :meth:`waitEvent`, or finishes. Suspended tasks are registered
+        again when what they wait for has happened, so waiting costs
+        nothing per tick.
+        """
+        root = self.root
+        root._tasks[g] = None
+        root._tasks_woken = True
+
+    def _resumeTask(self, state, value=None, error=None):
+        """
+        Resume a task suspended by yielding :func:`_suspend` for *state*.
+        Must be called from the thread running the main loop.
+        """
+        state.value = value
+        state.error = error
+        self.registerTask((state.task_event, state.task, state.parent))
 
     def unregisterTask(self, g):
-        if g in self.root._tasks:
-            self.root._tasks.remove(g)
+        self.root._tasks.pop(g, None)
 
-    def waitEvent(self, event, *channels, **kwargs):  # noqa
-        # TODO: C901: This has a high McCabe complexity score of 16.
-        # TODO: Refactor this method.
+    def scheduleTimer(self, expiry, callback, *args):
+        """
+        Schedule ``callback(*args)`` to be called by the root manager's
+        main loop once the time given by *expiry* (seconds since the epoch,
+        as returned by :func:`time.time`) has been reached.
 
-        if isinstance(event, Event):
+        All timers of a component tree are kept in a single heap owned by
+        the root manager. Only the earliest expiry limits the time spent
+        waiting for new events, so the cost per loop iteration does not
+        depend on the number of pending timers.
+
+        :returns: a :class:`TimerHandle` that may be used to cancel the call.
+        """
+        root = self.root
+        timer = TimerHandle(root, expiry, callback, args)
+
+        with root._lock:
+            timers = root._timers
+            if root._timers_cancelled > 64 and root._timers_cancelled * 2 > len(timers):
+                # Too many cancelled timers, get rid of them
+                timers[:] = [entry for entry in timers if entry[2].callback is not None]
+                heapify(timers)
+                root._timers_cancelled = 0
+
+            heappush(timers, (expiry, next(root._timers_order), timer))
+
+            handling = root._currently_handling
+            if isinstance(handling, generate_events):
+                th = root._executing_thread or root._flushing_thread
+                if _thread.get_ident() == (th.ident if th else None) and not root._waiting_in_loop:
+                    handling.reduce_time_left(max(0, expiry - time()))
+                else:
+                    # The event may already be waited for using a longer
+                    # timeout, make it start over.
+                    handling.reduce_time_left(0)
+
+        return timer
+
+    def _runTimers(self):
+        timers = self._timers
+        lock = self._lock
+        now = time()
+
+        while True:
+            with lock:
+                if not timers or timers[0][0] > now:
+                    return
+                expiry, _, timer = heappop(timers)
+                callback, args = timer.callback, timer.args
+                if callback is None:
+                    self._timers_cancelled -= 1
+                    continue
+                timer.callback = None
+                timer.args = ()
+
+            if self._monitor is not None:
+                self._monitor._timerRun(now - expiry)
+            try:
+                callback(*args)
+            except KeyboardInterrupt:
+                self.stop()
+            except SystemExit as e:
+                self.stop(e.code)
+            except BaseException:
+                self.fire(exception(*_exc_info()))
+
+    def _nextTimer(self):
+        """Return the expiry of the earliest pending timer or ``None``"""
+        timers = self._timers
+        with self._lock:
+            while timers and timers[0][2].callback is None:
+                heappop(timers)
+                self._timers_cancelled -= 1
+            return timers[0][0] if timers else None
+
+    @coroutine
+    def waitEvent(self, event, *channels, **kwargs):
+        """
+        Suspend execution until the given event (an event name or
+        an :class:`~.events.Event` instance) has been dispatched on one
+        of *channels* (by default the channel of this manager). This method
+        may only be invoked as argument to a ``yield`` on the top execution
+        level of a handler (e.g. "``yield self.waitEvent('started')``").
+        The handler is resumed when the handlers of the event are done,
+        after the handlers of its ``<name>_success`` and ``<name>_complete``
+        events (see :class:`~.events.Event`) if these are fired.
+
+        If *timeout* (in seconds) is given and the event has not been
+        dispatched before it has elapsed, a :class:`TimeoutError` is raised
+        in the waiting handler instead.
+
+        In an ``async def`` handler, use ``await self.waitEvent(...)``.
+        """
+        if isinstance(event, (Event, LightEvent)):
             event_object = event
             event_name = event.name
             channels = event.channels or channels
@@ -493,54 +1100,31 @@ class Manager:
             event_object = None
             event_name = event
 
-        state = _State(timeout=kwargs.get('timeout', -1))
-
-        def _on_event(self, event, *args, **kwargs):
-            if not state.run and (event_object is None or event is event_object):
-                self.removeHandler(_on_event_handler, event_name)
-                event.alert_done = True
-                state.run = True
-                state.event = event
-
-        def _on_done(self, event, *args, **kwargs):
-            if state.event == event.parent:
-                state.flag = True
-                self.registerTask((state.task_event, state.task, state.parent))
-                if state.timeout > 0:
-                    self.removeHandler(state.tick_handler, 'generate_events')
-
-        def _on_tick(self):
-            if state.timeout == 0:
-                self.registerTask(
-                    (
-                        state.task_event,
-                        (e for e in (ExceptionWrapper(TimeoutError()),)),
-                        state.parent,
-                    ),
-                )
-                self.removeHandler(_on_done_handler, '%s_done' % event_name)
-                self.removeHandler(_on_tick_handler, 'generate_events')
-            elif state.timeout > 0:
-                state.timeout -= 1
-
-        if not channels:
-            channels = (None,)
+        root = self.root
+        waiter = _Waiter(self, event_name, event_object, channels or (None,), kwargs.get('timeout', -1))
 
-        for channel in channels:
-            _on_event_handler = self.addHandler(handler(event_name, channel=channel)(_on_event))
-            _on_done_handler = self.addHandler(handler('%s_done' % event_name, channel=channel)(_on_done))
-            if state.timeout >= 0:
-                _on_tick_handler = state.tick_handler = self.addHandler(handler('generate_events', channel=channel)(_on_tick))
+        with root._lock:
+            root._waiters.setdefault(event_name, []).append(waiter)
+        if waiter.timeout >= 0:
+            waiter.timer = root.scheduleTimer(time() + waiter.timeout, root._expireWaiter, waiter)
 
-        yield state
+        yield waiter
 
-        self.removeHandler(_on_done_handler, '%s_done' % event_name)
+        if not waiter.flag:
+            # Not resumed by the manager, e.g. iterated from another thread
+            with root._lock:
+                root._dropWaiter(waiter)
+            if waiter.timer is not None:
+                waiter.timer.cancel()
 
-        if state.event is not None:
-            yield CallValue(state.event.value)
+        if waiter.error is not None:
+            yield ExceptionWrapper(waiter.error)
+        elif waiter.event is not None:
+            return (yield CallValue(waiter.event.value))
 
     wait = waitEvent
 
+    @coroutine
     def callEvent(self, event, *channels, **kwargs):
         """
         Fire the given event to the specified channels and suspend
@@ -550,13 +1134,30 @@ class Manager:
         It effectively creates and returns a generator
         that will be invoked by the main loop until the event has
         been dispatched (see :func:`circuits.core.handlers.handler`).
+
+        In an ``async def`` handler, use ``await self.callEvent(...)``.
         """
         value = self.fire(event, *channels)
         yield from self.waitEvent(event, *event.channels, **kwargs)
-        yield CallValue(value)
+        return (yield CallValue(value))
 
     call = callEvent
 
+    @coroutine
+    def _waitDone(self, event):
+        """Suspend until all handlers of the fired *event* are done"""
+        waiter = _Waiter(self, event.name, event, ())
+        waiter.event = event
+        with self._lock:
+            self._waiters_done.setdefault(event, []).append(waiter)
+        event.alert_done = True
+
+        yield waiter
+
+        if not waiter.flag:
+            with self._lock:
+                self._dropWaiter(waiter)
+
     def _flush(self):
         # Handle events currently on queue, but none of the newly generated
         # events. Note that _flush can be called recursively.
@@ -577,58 +1178,86 @@ class Manager:
 
     flush = flushEvents
 
+    def _compileDispatchPlan(self, event, channels):
+        h = (self.getHandlers(event, channel) for channel in channels)
+
+        event_handlers = sorted(
+            chain(*h),
+            key=attrgetter('priority'),
+            reverse=True,
+        )
+
+        if isinstance(event, generate_events):
+            from .helpers import FallBackGenerator
+
+            event_handlers.append(FallBackGenerator()._on_generate_events)
+            return _DispatchPlan(event_handlers, generate_events=True)
+        if isinstance(event, exception) and len(event_handlers) == 0:
+            from .helpers import FallBackExceptionHandler
+
+            event_handlers.append(FallBackExceptionHandler()._on_exception)
+        elif isinstance(event, signal) and len(event_handlers) == 0:
+            from .helpers import FallBackSignalHandler
+
+            event_handlers.append(FallBackSignalHandler()._on_signal)
+
+        return _DispatchPlan(event_handlers)
+
     def _dispatcher(self, event, channels, remaining):  # noqa
         # TODO: C901: This has a high McCabe complexity score of 22.
         # TODO: Refactor this method.
 
+        instrument = self._instrument
+        timed = instrument is not None and instrument.dispatching(event)
+
         if event.cancelled:
             return
 
-        if event.complete:
-            if not getattr(event, 'cause', None):
-                event.cause = event
-            event.effects = 1  # event itself counts (must be done)
-        eargs = event.args
-        ekwargs = event.kwargs
+        if self._waiters and event.name in self._waiters:
+            self._matchWaiters(event, channels)
 
         if self._cache_needs_refresh:
-            # Don't call self._cache.clear() from other threads,
+            # Don't modify self._cache from other threads,
             # this may interfere with cache rebuild.
-            self._cache.clear()
-            self._cache_needs_refresh = False
+            self._refreshCache()
         try:  # try/except is fastest if successful in most cases
-            event_handlers = self._cache[(event.name, channels)]
+            plan = self._cache[event.name][channels]
         except KeyError:
-            h = (self.getHandlers(event, channel) for channel in channels)
-
-            event_handlers = sorted(
-                chain(*h),
-                key=attrgetter('priority'),
-                reverse=True,
-            )
-
-            if isinstance(event, generate_events):
-                from .helpers import FallBackGenerator
-
-                event_handlers.append(FallBackGenerator()._on_generate_events)
-            elif isinstance(event, exception) and len(event_handlers) == 0:
-                from .helpers import FallBackExceptionHandler
-
-                event_handlers.append(FallBackExceptionHandler()._on_exception)
-            elif isinstance(event, signal) and len(event_handlers) == 0:
-                from .helpers import FallBackSignalHandler
-
-                event_handlers.append(FallBackSignalHandler()._on_signal)
+            plan = self._compileDispatchPlan(event, channels)
+            self._cache.setdefault(event.name, {})[channels] = plan
+
+        if (
+            plan.plain
+            and not timed
+            and not (event.success or event.failure or event.complete or event.alert_done)
+            and not getattr(event, 'cause', None)
+        ):
+            self._dispatchPlain(event, plan)
+            return
 
-            self._cache[(event.name, channels)] = event_handlers
+        if event.complete:
+            if not getattr(event, 'cause', None):
+                event.cause = event
+            event.effects = 1  # event itself counts (must be done)
+        eargs = event.args
+        ekwargs = event.kwargs
 
-        if isinstance(event, generate_events):
+        ticking = plan.generate_events
+        if ticking:
+            # Pollers wait for I/O, that's not time spent handling
+            timed = False
+            polling = perf_counter()
             with self._lock:
                 self._currently_handling = event
-                if remaining > 0 or len(self._queue) or not self._running:
+                if remaining > 0 or len(self._queue) or not self._running or self._tasks_woken or self._queue_pressure:
                     event.reduce_time_left(0)
-                elif self._tasks:
-                    event.reduce_time_left(TIMEOUT)
+                else:
+                    if self._tasks:
+                        # Tasks that poll (yield None) are resumed regularly
+                        event.reduce_time_left(TIMEOUT)
+                    expiry = self._nextTimer()
+                    if expiry is not None:
+                        event.reduce_time_left(max(0, expiry - time()))
                 # From now on, firing an event will reduce time left
                 # to 0, which prevents event handlers from waiting (or wakes
                 # them up with resume if they should be waiting already)
@@ -638,10 +1267,12 @@ class Manager:
         value = None
         err = None
 
-        for event_handler in event_handlers:
+        for event_handler, pass_event in plan.handlers:
             event.handler = event_handler
+            if timed:
+                started = perf_counter()
             try:
-                value = event_handler(event, *eargs, **ekwargs) if event_handler.event else event_handler(*eargs, **ekwargs)
+                value = event_handler(event, *eargs, **ekwargs) if pass_event else event_handler(*eargs, **ekwargs)
             except KeyboardInterrupt:
                 self.stop()
             except SystemExit as e:
@@ -654,9 +1285,13 @@ class Manager:
                     self.fire(event.child('failure', event, err), *event.channels)
 
                 self.fire(exception(*err, handler=event_handler, fevent=event))
+            if timed:
+                instrument.record(event, event_handler, perf_counter() - started)
 
             if value is not None:
-                if isinstance(value, GeneratorType):
+                if isinstance(value, (GeneratorType, CoroutineType)):
+                    if timed:
+                        instrument.started(value, event_handler)
                     event.waitingHandlers += 1
                     event.value.promise = True
                     self.registerTask((event, value, None))
@@ -665,29 +1300,122 @@ class Manager:
 
             # it is kind of a temporal hack to allow processing
             # of tasks, added in one of event handlers here
-            if isinstance(event, generate_events) and self._tasks:
-                event.reduce_time_left(TIMEOUT)
+            if ticking and self._tasks:
+                event.reduce_time_left(0 if self._tasks_woken else TIMEOUT)
 
             if event.stopped:
                 break  # Stop further event processing
 
+        if ticking and self._monitor is not None:
+            self._monitor._polling(perf_counter() - polling)
+
         self._currently_handling = None
         self._eventDone(event, err)
 
+    def _dispatchPlain(self, event, plan):
+        # The handler loop of _dispatcher() for the common case of an event
+        # that needs no feedback, isn't ticking and isn't timed.
+        eargs = event.args
+        ekwargs = event.kwargs
+        self._currently_handling = event
+
+        value = None
+        err = None
+
+        for event_handler, pass_event in plan.handlers:
+            event.handler = event_handler
+            try:
+                value = event_handler(event, *eargs, **ekwargs) if pass_event else event_handler(*eargs, **ekwargs)
+            except KeyboardInterrupt:
+                self.stop()
+            except SystemExit as e:
+                self.stop(e.code)
+            except BaseException:
+                value = err = _exc_info()
+                event.value.errors = True
+                self.fire(exception(*err, handler=event_handler, fevent=event))
+
+            if value is not None:
+                if isinstance(value, (GeneratorType, CoroutineType)):
+                    event.waitingHandlers += 1
+                    event.value.promise = True
+                    self.registerTask((event, value, None))
+                else:
+                    event.value.value = value
+
+            if event.stopped:
+                break  # Stop further event processing
+
+        self._currently_handling = None
+        if event.waitingHandlers:
+            return  # Done when its tasks are (see processTask)
+        if event._value is not None:
+            event._value.done = True
+
+    def _matchWaiters(self, event, channels):
+        """Hand the dispatched *event* to the tasks waiting for it"""
+        with self._lock:
+            waiters = self._waiters.get(event.name)
+            matched = [waiter for waiter in waiters if waiter.matches(event, channels)] if waiters else None
+            if not matched:
+                return
+
+            for waiter in matched:
+                waiters.remove(waiter)
+                waiter.event = event
+            if not waiters:
+                del self._waiters[event.name]
+            self._waiters_done.setdefault(event, []).extend(matched)
+
+        # Resume the waiters once all handlers are done (see _eventDone)
+        event.alert_done = True
+
+    def _dropWaiter(self, waiter):
+        # Must be called with self._lock held
+        if waiter.event is None:
+            registry, key = self._waiters, waiter.name
+        else:
+            registry, key = self._waiters_done, waiter.event
+
+        waiters = registry.get(key)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del registry[key]
+
+    def _wakeWaiter(self, waiter, error=None):
+        if waiter.flag:
+            return
+
+        waiter.flag = True
+        waiter.error = error
+        if waiter.timer is not None:
+            waiter.timer.cancel()
+        if waiter.task is not None:
+            self.registerTask((waiter.task_event, waiter.task, waiter.parent))
+
+    def _expireWaiter(self, waiter):
+        with self._lock:
+            self._dropWaiter(waiter)
+        self._wakeWaiter(waiter, TimeoutError())
+
     def _eventDone(self, event, err=None):
         if event.waitingHandlers:
             return
 
-        # The "%s_done" event is for internal use by waitEvent only.
-        # Use the "%s_success" event in your application if you are
-        # interested in being notified about the last handler for
-        # an event having been invoked.
+        if event._value is not None:
+            event._value.done = True
+
+        waiters = ()
         if event.alert_done:
-            self.fire(event.child('done', event.value.value), *event.channels)
+            with self._lock:
+                waiters = self._waiters_done.pop(event, ())
 
+        followup = None
         if err is None and event.success:
             channels = getattr(event, 'success_channels', event.channels)
-            self.fire(event.child('success', event, event.value.value), *channels)
+            followup = event.child('success', event, event.value.value)
+            self.fire(followup, *channels)
 
         while True:
             # cause attributes indicates interest in completion event
@@ -699,10 +1427,8 @@ class Manager:
             if event.effects > 0:
                 break  # some nested events remain to be completed
             if event.complete:  # does this event want signaling?
-                self.fire(
-                    event.child('complete', event, event.value.value),
-                    *getattr(event, 'complete_channels', event.channels),
-                )
+                followup = event.child('complete', event, event.value.value)
+                self.fire(followup, *getattr(event, 'complete_channels', event.channels))
 
             # this event and nested events are done now
             delattr(event, 'cause')
@@ -710,6 +1436,25 @@ class Manager:
             # cause has one of its nested events done, decrement and check
             event = cause
 
+        if not waiters:
+            return
+
+        # Resume the tasks waiting for the event (see waitEvent) once the
+        # "<name>_success" and "<name>_complete" events fired above have
+        # been handled, i.e. when the last of them is done.
+        if followup is not None:
+            with self._lock:
+                self._waiters_done.setdefault(followup, []).extend(waiters)
+            followup.alert_done = True
+            return
+
+        now = time()
+        for waiter in waiters:
+            if waiter.timer is not None and waiter.timer.expiry <= now:
+                self._wakeWaiter(waiter, TimeoutError())
+            else:
+                self._wakeWaiter(waiter)
+
     def _signal_handler(self, signo, stack):
         self.fire(signal(signo, stack))
 
@@ -770,6 +1515,10 @@ class Manager:
 
         self._running = False
 
+        if self._queue_cond is not None:
+            with self._lock:
+                self._queue_cond.notify_all()
+
         self.fire(stopped(self))
 
         if self.root._executing_thread is None:
@@ -783,6 +1532,9 @@ class Manager:
         # TODO: C901: This has a high McCabe complexity score of 16.
         # TODO: Refactor this method.
 
+        if isinstance(task, CoroutineType):
+            return self._processCoroutine(event, task)
+
         value = None
         try:
             value = next(task)
@@ -830,9 +1582,10 @@ class Manager:
                     raise value.extract()
             elif isinstance(value, Sleep):
                 if value is not task:
+                    # Park the task until the sleep expires
                     value.task = (event, task, parent)
-                    self.registerTask((event, value, parent))
                     self.unregisterTask((event, task, parent))
+                    self.scheduleTimer(value.expiry, self.registerTask, value.task)
             elif value is not None:
                 event.value.value = value
         except StopIteration:
@@ -841,10 +1594,6 @@ class Manager:
 
             if parent:
                 self.registerTask((event, parent, None))
-            elif hasattr(task, 'task'):
-                # TODO: The subtask is considered a "waiting handler"
-                event.waitingHandlers += 1
-                self.registerTask(task.task)
             elif event.waitingHandlers == 0:
                 event.value.inform(True)
                 self._eventDone(event)
@@ -866,6 +1615,102 @@ class Manager:
 
             self.fire(exception(*err, handler=None, fevent=event))
 
+    def _processCoroutine(self, event, coro):
+        """
+        Run the coroutine of an ``async def`` handler for *event* until it
+        awaits something that isn't available yet or returns.
+
+        A suspended coroutine is not registered as a task. It is registered
+        again by whatever it awaits (an event being done, a timer expiring),
+        so it is resumed by the next :meth:`tick` after that has happened.
+        """
+        task = (event, coro, None)
+        value = error = None
+        try:
+            while True:
+                awaited = coro.send(value) if error is None else coro.throw(error)
+                value = error = None
+                if isinstance(awaited, CallValue):
+                    value = awaited.value
+                elif isinstance(awaited, ExceptionWrapper):
+                    error = awaited.extract()
+                elif awaited is None or isinstance(awaited, (_State, Sleep)):
+                    break
+                elif getattr(awaited, '_asyncio_future_blocking', False):
+                    # An asyncio future, e.g. awaited by an asyncio library
+                    # on the loop of circuits.core.pollers.AsyncioPoller
+                    awaited._asyncio_future_blocking = False
+                    break
+                else:
+                    error = RuntimeError(f'{awaited!r} cannot be awaited by a handler')
+        except StopIteration as e:
+            self.unregisterTask(task)
+            if e.value is not None:
+                event.value.value = e.value
+            event.waitingHandlers -= 1
+            if event.waitingHandlers == 0:
+                event.value.inform(True)
+                self._eventDone(event)
+            return
+        except KeyboardInterrupt:
+            self.stop()
+            return
+        except SystemExit as e:
+            self.stop(e.code)
+            return
+        except BaseException:
+            self.unregisterTask(task)
+
+            err = _exc_info()
+
+            event.value.value = err
+            event.value.errors = True
+            event.value.inform(True)
+
+            if event.failure:
+                self.fire(event.child('failure', event, err), *event.channels)
+
+            self.fire(exception(*err, handler=None, fevent=event))
+            return
+
+        if awaited is None:
+            return  # e.g. ``await asyncio.sleep(0)``, resume on next tick
+
+        self.unregisterTask(task)
+        if isinstance(awaited, _State):
+            awaited.task_event = event
+            awaited.task = coro
+            awaited.parent = None
+        elif isinstance(awaited, Sleep):
+            self.scheduleTimer(awaited.expiry, self.registerTask, task)
+        else:
+            awaited.add_done_callback(lambda future: self._wakeTask(task))
+
+    def _wakeTask(self, task):
+        """
+        Register *task* from outside of the main loop's own work (another
+        thread or a callback run while waiting for new events) and make
+        the main loop stop waiting.
+        """
+        with self._lock:
+            self.registerTask(task)
+            handling = self._currently_handling
+            if isinstance(handling, generate_events):
+                handling.reduce_time_left(0)
+
+    def _processTasksTimed(self):
+        instrument = self._instrument
+        for task in list(self._tasks):
+            event, coro, parent = task
+            # Tasks delegated to (e.g. by callEvent) count for their parent
+            handler = instrument.owner(coro if parent is None else parent)
+            if handler is None:
+                self.processTask(*task)
+                continue
+            started = perf_counter()
+            self.processTask(*task)
+            instrument.record(event, handler, perf_counter() - started)
+
     def tick(self, timeout=-1):
         """
         Execute all possible actions once. Process all registered tasks
@@ -880,17 +1725,38 @@ class Manager:
             has been taken.
         :type timeout: float, measuring seconds
         """
+        monitor = self._monitor
+        if monitor is not None:
+            started = perf_counter()
+
         # process tasks
+        if self._timers:
+            self._runTimers()
+
         if self._tasks:
-            for task in self._tasks.copy():
-                self.processTask(*task)
+            self._tasks_woken = False
+            if self._instrument is None:
+                for task in list(self._tasks):
+                    self.processTask(*task)
+            else:
+                self._processTasksTimed()
+
+        if self._queue_high is not None:
+            with self._lock:
+                self._queue_consumer = _thread.get_ident()
+                self._checkQueue()
 
         if self._running:
             self.fire(generate_events(self._lock, timeout), '*')
 
         if len(self._queue):
+            if monitor is not None:
+                monitor._flushing(len(self._queue))
             self.flush()
 
+        if monitor is not None:
+            monitor._ticked(perf_counter() - started)
+
     def run(self, socket=None):
         """
         Run this manager. The method fires the
@@ -0,0 +1,121 @@
+"""
+LoopMonitor component used to watch the main loop for handlers that
+block it, measuring the duration of each tick and the lateness of timers.
+"""
+
+from collections import deque
+
+from .components import BaseComponent
+from .events import Event
+
+
+class loop_lag(Event):
+    """
+    loop_lag Event
+
+    This Event is sent by a :class:`LoopMonitor` when a measurement of
+    the main loop exceeds its threshold.
+
+    :param metric: The name of the measurement (``'busy'``, ``'lag'``
+                   or ``'queue'``)
+    :type  metric: str
+
+    :param value: The measured value (seconds or number of events)
+    :type  value: float or int
+
+    :param threshold: The threshold that was exceeded
+    :type  threshold: float or int
+    """
+
+    def __init__(self, metric, value, threshold):
+        super().__init__(metric, value, threshold)
+
+
+class LoopMonitor(BaseComponent):
+    """
+    Create a new LoopMonitor Component
+
+    Measures every tick of the root manager it is registered with and
+    keeps the last *window* measurements of:
+
+    - ``tick``: the duration of the tick
+    - ``poll``: the time spent waiting for I/O (in the pollers)
+    - ``busy``: the time spent running timers, tasks and handlers
+    - ``queue``: the number of events queued when the flush started
+    - ``lag``: the lateness of timers, the time from their expiry until
+      they are run
+
+    A :class:`loop_lag` event is fired whenever ``busy``, ``lag`` or
+    ``queue`` exceeds its threshold, a threshold of ``None`` disables
+    the event. There can only be one LoopMonitor per root manager.
+
+    :param busy: threshold of the time spent running (seconds)
+    :param lag: threshold of the lateness of timers (seconds)
+    :param queue: threshold of the number of queued events
+    :param window: the number of measurements kept for each metric
+    """
+
+    channel = 'monitor'
+
+    metrics = ('tick', 'poll', 'busy', 'queue', 'lag')
+
+    def __init__(self, busy=0.1, lag=0.1, queue=None, window=1000, channel=channel):
+        super().__init__(channel=channel)
+
+        self.thresholds = {'busy': busy, 'lag': lag, 'queue': queue}
+        self.samples = {metric: deque(maxlen=window) for metric in self.metrics}
+
+        self._polled = 0.0
+
+    def _updateRoot(self, root):
+        if self.root._monitor is self:
+            self.root._monitor = None
+        super()._updateRoot(root)
+        root._monitor = self
+
+    def percentile(self, metric, p):
+        """
+        Return the *p*-th percentile of the kept measurements of
+        *metric*, or ``None`` if there are none yet.
+        """
+        samples = sorted(self.samples[metric])
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(p / 100.0 * len(samples)))]
+
+    def stats(self):
+        """
+        Return the 50th and 99th percentile and the maximum of the kept
+        measurements of each metric.
+        """
+        return {
+            metric: {
+                'p50': self.percentile(metric, 50),
+                'p99': self.percentile(metric, 99),
+                'max': max(self.samples[metric], default=None),
+            }
+            for metric in self.metrics
+        }
+
+    def _add(self, metric, value):
+        self.samples[metric].append(value)
+        threshold = self.thresholds.get(metric)
+        if threshold is not None and value > threshold:
+            self.fire(loop_lag(metric, value, threshold))
+
+    # The following methods are invoked by the root manager
+
+    def _flushing(self, queued):
+        self._add('queue', queued)
+
+    def _polling(self, duration):
+        self._polled += duration
+
+    def _timerRun(self, lateness):
+        self._add('lag', lateness)
+
+    def _ticked(self, duration):
+        polled, self._polled = self._polled, 0.0
+        self.samples['tick'].append(duration)
+        self.samples['poll'].append(polled)
+        self._add('busy', duration - polled)
@@ -6,8 +6,11 @@ descriptors for read/write events. Pollers:
 - Select
 - Poll
 - EPoll
+- KQueue
+- AsyncioPoller
 """
 
+import asyncio
 import contextlib
 import os
 import platform
@@ -15,29 +18,50 @@ import select
 import sys
 from errno import EBADF, EINTR
 from socket import AF_INET, SOCK_STREAM, create_connection, socket
-from threading import Thread
+from threading import Thread, current_thread
 
 from circuits.core.handlers import handler
 
 from .components import BaseComponent
-from .events import Event
+from .events import LightEvent, exception, started
 
 
-class _read(Event):
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+class _read(LightEvent):
     """_read Event"""
 
+    __slots__ = ()
+
+    def origin(self):
+        return self.args[0]
+
 
-class _write(Event):
+class _write(LightEvent):
     """_write Event"""
 
+    __slots__ = ()
 
-class _error(Event):
+    def coalesce(self):
+        # Pending readiness of a descriptor needs to be handled once
+        return self.args[0]
+
+
+class _error(LightEvent):
     """_error Event"""
 
+    __slots__ = ()
 
-class _disconnect(Event):
+
+class _disconnect(LightEvent):
     """_disconnect Event"""
 
+    __slots__ = ()
+
 
 class BasePoller(BaseComponent):
     channel = None
@@ -45,11 +69,14 @@ class BasePoller(BaseComponent):
     def __init__(self, channel=channel):
         super().__init__(channel=channel)
 
-        self._read = []
-        self._write = []
+        self._read = set()
+        self._write = set()
         self._targets = {}
+        self._callbacks = {}
 
         self._ctrl_recv, self._ctrl_send = self._create_control_con()
+        self._ctrl_pending = False
+        self._paused = False
 
     def _create_control_con(self):
         if platform.system() == 'Linux':
@@ -88,13 +115,37 @@ class BasePoller(BaseComponent):
         event.stop()
         self._generate_events(event)
 
+    @handler('queue_pressure')
+    def _on_queue_pressure(self, queued):
+        self._paused = True
+        self._updateReading()
+
+    @handler('queue_relief')
+    def _on_queue_relief(self, queued):
+        self._paused = False
+        self._updateReading()
+
+    def _updateReading(self):
+        """
+        Apply a change of :attr:`_paused` to the registered readers.
+        While paused, no readers but the control connection are polled,
+        so no new data is read until the event queue has drained.
+        """
+
     def resume(self):
+        # One byte pending in the control connection is enough to wake up
+        # the poller, don't write another one until it has been read.
+        if self._ctrl_pending:
+            return
+        self._ctrl_pending = True
+
         if isinstance(self._ctrl_send, socket):
             self._ctrl_send.send(b'\0')
         else:
             os.write(self._ctrl_send, b'\0')
 
     def _read_ctrl(self):
+        self._ctrl_pending = False
         try:
             if isinstance(self._ctrl_recv, socket):
                 return self._ctrl_recv.recv(1)
@@ -104,25 +155,38 @@ class BasePoller(BaseComponent):
 
     def addReader(self, source, fd):
         channel = getattr(source, 'channel', '*')
-        self._read.append(fd)
+        self._read.add(fd)
         self._targets[fd] = channel
 
     def addWriter(self, source, fd):
         channel = getattr(source, 'channel', '*')
-        self._write.append(fd)
+        self._write.add(fd)
         self._targets[fd] = channel
 
     def removeReader(self, fd):
-        if fd in self._read:
-            self._read.remove(fd)
-        if not (fd in self._read or fd in self._write) and fd in self._targets:
-            del self._targets[fd]
+        self._read.discard(fd)
+        if fd not in self._write:
+            self._targets.pop(fd, None)
+            self._callbacks.pop(fd, None)
 
     def removeWriter(self, fd):
-        if fd in self._write:
-            self._write.remove(fd)
-        if not (fd in self._read or fd in self._write) and fd in self._targets:
-            del self._targets[fd]
+        self._write.discard(fd)
+        if fd not in self._read:
+            self._targets.pop(fd, None)
+            self._callbacks.pop(fd, None)
+
+    def setCallbacks(self, fd, read=None, write=None, disconnect=None):
+        """
+        Call *read*, *write* or *disconnect* with *fd* when it is readable,
+        writable or disconnected, instead of firing a ``_read``, ``_write``
+        or ``_disconnect`` event to its source. The callbacks are called
+        while polling, their return value is ignored and exceptions are
+        fired as :class:`~circuits.core.events.exception` events.
+
+        The callbacks are forgotten when *fd* is no longer polled, they
+        must be set again when it is added again.
+        """
+        self._callbacks[fd] = {_read: read, _write: write, _disconnect: disconnect}
 
     def isReading(self, fd):
         return fd in self._read
@@ -131,16 +195,38 @@ class BasePoller(BaseComponent):
         return fd in self._write
 
     def discard(self, fd):
-        if fd in self._read:
-            self._read.remove(fd)
-        if fd in self._write:
-            self._write.remove(fd)
-        if fd in self._targets:
-            del self._targets[fd]
+        self._read.discard(fd)
+        self._write.discard(fd)
+        self._targets.pop(fd, None)
+        self._callbacks.pop(fd, None)
 
     def getTarget(self, fd):
         return self._targets.get(fd, self.parent)
 
+    def _notify(self, event, fd):
+        # Call the callback of fd for event (see setCallbacks()), or fire
+        # the event to its source.
+        callbacks = self._callbacks.get(fd)
+        callback = callbacks[event] if callbacks is not None else None
+        if callback is None:
+            # Unless fd has been discarded by a callback of this poll
+            if fd in self._targets:
+                self._fireEvent(event(fd), self.getTarget(fd))
+            return
+
+        try:
+            callback(fd)
+        except Exception:
+            self.fire(exception(*sys.exc_info(), handler=callback))
+
+    def isEdgeTriggered(self, fd):
+        """
+        Return True if readiness of *fd* is only reported when it changes,
+        in which case its source must read and write until the operation
+        would block.
+        """
+        return False
+
 
 class Select(BasePoller):
     """
@@ -157,10 +243,10 @@ class Select(BasePoller):
     def __init__(self, channel=channel):
         super().__init__(channel=channel)
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
 
     def _preenDescriptors(self):
-        for socks in (self._read[:], self._write[:]):
+        for socks in (list(self._read), list(self._write)):
             for sock in socks:
                 try:
                     select.select([sock], [sock], [sock], 0)
@@ -171,11 +257,12 @@ class Select(BasePoller):
         try:
             if not any([self._read, self._write]):
                 return None
+            read = [self._ctrl_recv] if self._paused else self._read
             timeout = event.time_left
             if timeout < 0:
-                r, w, _ = select.select(self._read, self._write, [])
+                r, w, _ = select.select(read, self._write, [])
             else:
-                r, w, _ = select.select(self._read, self._write, [], timeout)
+                r, w, _ = select.select(read, self._write, [], timeout)
         except ValueError:
             # Possibly a file descriptor has gone negative?
             return self._preenDescriptors()
@@ -199,14 +286,14 @@ class Select(BasePoller):
 
         for sock in w:
             if self.isWriting(sock):
-                self.fire(_write(sock), self.getTarget(sock))
+                self._notify(_write, sock)
 
         for sock in r:
             if sock == self._ctrl_recv:
                 self._read_ctrl()
                 continue
             if self.isReading(sock):
-                self.fire(_read(sock), self.getTarget(sock))
+                self._notify(_read, sock)
         return None
 
 
@@ -224,33 +311,51 @@ class Poll(BasePoller):
         super().__init__(channel=channel)
 
         self._map = {}
+        self._registered = {}
         self._poller = select.poll()
 
         self._disconnected_flag = select.POLLHUP | select.POLLERR | select.POLLNVAL
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
         self._updateRegistration(self._ctrl_recv)
 
     def _updateRegistration(self, fd):
-        fileno = fd.fileno() if not isinstance(fd, int) else fd
-
-        with contextlib.suppress(KeyError, ValueError):
-            self._poller.unregister(fileno)
-
+        # self._registered maps each registered fd to its fileno, which a
+        # closed socket doesn't tell anymore, and its event mask.
         mask = 0
 
-        if fd in self._read:
+        if fd in self._read and not (self._paused and fd != self._ctrl_recv):
             mask = mask | select.POLLIN
         if fd in self._write:
             mask = mask | select.POLLOUT
 
-        if mask:
-            self._poller.register(fd, mask)
-            self._map[fileno] = fd
+        fileno, registered = self._registered.get(fd, (None, 0))
+        if mask == registered:
+            if not mask and fd not in self._read:
+                super().discard(fd)
+            return
+
+        if not mask:
+            with contextlib.suppress(KeyError, ValueError, OSError):
+                self._poller.unregister(fileno)
+            del self._registered[fd]
+            if fd not in self._read:
+                super().discard(fd)
+                self._map.pop(fileno, None)
+            return
+
+        if fileno is None:
+            fileno = fd.fileno() if not isinstance(fd, int) else fd
+            self._poller.register(fileno, mask)
         else:
-            super().discard(fd)
-            with contextlib.suppress(KeyError):
-                del self._map[fileno]
+            self._poller.modify(fileno, mask)
+        self._registered[fd] = (fileno, mask)
+        self._map[fileno] = fd
+
+    def _updateReading(self):
+        for fd in list(self._read):
+            if fd != self._ctrl_recv:
+                self._updateRegistration(fd)
 
     def addReader(self, source, fd):
         super().addReader(source, fd)
@@ -294,22 +399,18 @@ class Poll(BasePoller):
             return
 
         if event & self._disconnected_flag and not (event & select.POLLIN):
-            self.fire(_disconnect(fd), self.getTarget(fd))
-            self._poller.unregister(fileno)
-            super().discard(fd)
-            del self._map[fileno]
+            self._notify(_disconnect, fd)
+            self.discard(fd)
         else:
             try:
                 if event & select.POLLIN:
-                    self.fire(_read(fd), self.getTarget(fd))
+                    self._notify(_read, fd)
                 if event & select.POLLOUT:
-                    self.fire(_write(fd), self.getTarget(fd))
+                    self._notify(_write, fd)
             except Exception as e:
-                self.fire(_error(fd, e), self.getTarget(fd))
-                self.fire(_disconnect(fd), self.getTarget(fd))
-                self._poller.unregister(fileno)
-                super().discard(fd)
-                del self._map[fileno]
+                self._fireEvent(_error(fd, e), self.getTarget(fd))
+                self._notify(_disconnect, fd)
+                self.discard(fd)
 
 
 class EPoll(BasePoller):
@@ -318,50 +419,90 @@ class EPoll(BasePoller):
 
     Creates a new EPoll Poller Component that uses the epoll poller
     implementation.
+
+    With *edge_triggered* the sockets of sources that drain them (whose
+    ``drains`` attribute is true, such as the components of
+    :mod:`circuits.net.sockets`) are registered edge-triggered: a socket
+    is reported once when it becomes readable or writable, instead of on
+    every poll until it has been read or written. Other sources remain
+    level-triggered.
     """
 
     channel = 'epoll'
 
-    def __init__(self, channel=channel):
+    def __init__(self, channel=channel, edge_triggered=False):
         super().__init__(channel=channel)
 
+        self.edge_triggered = edge_triggered
+
         self._map = {}
+        self._edge = set()
+        self._registered = {}
         self._poller = select.epoll()
 
         self._disconnected_flag = select.EPOLLHUP | select.EPOLLERR
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
         self._updateRegistration(self._ctrl_recv)
 
     def _updateRegistration(self, fd):
-        try:
-            fileno = fd.fileno() if not isinstance(fd, int) else fd
-            self._poller.unregister(fileno)
-        except (OSError, ValueError) as e:
-            if e.args[0] == EBADF:
-                keys = [k for k, v in list(self._map.items()) if v == fd]
-                for key in keys:
-                    del self._map[key]
-
+        # See Poll._updateRegistration()
         mask = 0
 
-        if fd in self._read:
+        if fd in self._read and not (self._paused and fd != self._ctrl_recv):
             mask = mask | select.EPOLLIN
         if fd in self._write:
             mask = mask | select.EPOLLOUT
+        if mask and fd in self._edge:
+            mask = mask | select.EPOLLET
+
+        fileno, registered = self._registered.get(fd, (None, 0))
+        if mask == registered:
+            if not mask and fd not in self._read:
+                super().discard(fd)
+                self._edge.discard(fd)
+            return
+
+        if not mask:
+            # Closed descriptors have been removed by the kernel
+            with contextlib.suppress(OSError, ValueError):
+                self._poller.unregister(fileno)
+            del self._registered[fd]
+            if fd not in self._read:
+                super().discard(fd)
+                self._edge.discard(fd)
+                self._map.pop(fileno, None)
+            return
 
-        if mask:
-            self._poller.register(fd, mask)
-            self._map[fileno] = fd
+        if fileno is None:
+            fileno = fd.fileno() if not isinstance(fd, int) else fd
+            self._poller.register(fileno, mask)
         else:
-            super().discard(fd)
+            try:
+                self._poller.modify(fileno, mask)
+            except FileNotFoundError:
+                # Closed and reopened, the kernel forgot the old one
+                self._poller.register(fileno, mask)
+        self._registered[fd] = (fileno, mask)
+        self._map[fileno] = fd
+
+    def _updateReading(self):
+        for fd in list(self._read):
+            if fd != self._ctrl_recv:
+                self._updateRegistration(fd)
+
+    def _addEdge(self, source, fd):
+        if self.edge_triggered and getattr(source, 'drains', False):
+            self._edge.add(fd)
 
     def addReader(self, source, fd):
         super().addReader(source, fd)
+        self._addEdge(source, fd)
         self._updateRegistration(fd)
 
     def addWriter(self, source, fd):
         super().addWriter(source, fd)
+        self._addEdge(source, fd)
         self._updateRegistration(fd)
 
     def removeReader(self, fd):
@@ -375,6 +516,10 @@ class EPoll(BasePoller):
     def discard(self, fd):
         super().discard(fd)
         self._updateRegistration(fd)
+        self._edge.discard(fd)
+
+    def isEdgeTriggered(self, fd):
+        return fd in self._edge
 
     def _generate_events(self, event):
         try:
@@ -401,22 +546,18 @@ class EPoll(BasePoller):
             return
 
         if event & self._disconnected_flag and not (event & select.POLLIN):
-            self.fire(_disconnect(fd), self.getTarget(fd))
-            self._poller.unregister(fileno)
-            super().discard(fd)
-            del self._map[fileno]
+            self._notify(_disconnect, fd)
+            self.discard(fd)
         else:
             try:
                 if event & select.EPOLLIN:
-                    self.fire(_read(fd), self.getTarget(fd))
+                    self._notify(_read, fd)
                 if event & select.EPOLLOUT:
-                    self.fire(_write(fd), self.getTarget(fd))
+                    self._notify(_write, fd)
             except Exception as e:
-                self.fire(_error(fd, e), self.getTarget(fd))
-                self.fire(_disconnect(fd), self.getTarget(fd))
-                self._poller.unregister(fileno)
-                super().discard(fd)
-                del self._map[fileno]
+                self._fireEvent(_error(fd, e), self.getTarget(fd))
+                self._notify(_disconnect, fd)
+                self.discard(fd)
 
 
 class KQueue(BasePoller):
@@ -434,14 +575,15 @@ class KQueue(BasePoller):
         self._map = {}
         self._poller = select.kqueue()
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
         self._map[self._ctrl_recv.fileno()] = self._ctrl_recv
         self._poller.control([select.kevent(self._ctrl_recv, select.KQ_FILTER_READ, select.KQ_EV_ADD)], 0)
 
     def addReader(self, source, sock):
         super().addReader(source, sock)
         self._map[sock.fileno()] = sock
-        self._poller.control([select.kevent(sock, select.KQ_FILTER_READ, select.KQ_EV_ADD)], 0)
+        flags = select.KQ_EV_ADD | select.KQ_EV_DISABLE if self._paused else select.KQ_EV_ADD
+        self._poller.control([select.kevent(sock, select.KQ_FILTER_READ, flags)], 0)
 
     def addWriter(self, source, sock):
         super().addWriter(source, sock)
@@ -456,6 +598,12 @@ class KQueue(BasePoller):
         super().removeWriter(sock)
         self._poller.control([select.kevent(sock, select.KQ_FILTER_WRITE, select.KQ_EV_DELETE)], 0)
 
+    def _updateReading(self):
+        flags = select.KQ_EV_DISABLE if self._paused else select.KQ_EV_ENABLE
+        changes = [select.kevent(sock, select.KQ_FILTER_READ, flags) for sock in self._read if sock != self._ctrl_recv]
+        if changes:
+            self._poller.control(changes, 0)
+
     def discard(self, sock):
         super().discard(sock)
         del self._map[sock.fileno()]
@@ -490,15 +638,226 @@ class KQueue(BasePoller):
             return
 
         if event.flags & select.KQ_EV_ERROR:
-            self.fire(_error(sock, 'error'), self.getTarget(sock))
+            self._fireEvent(_error(sock, 'error'), self.getTarget(sock))
         elif event.flags & select.KQ_EV_EOF:
-            self.fire(_disconnect(sock), self.getTarget(sock))
+            self._notify(_disconnect, sock)
         elif event.filter == select.KQ_FILTER_WRITE:
-            self.fire(_write(sock), self.getTarget(sock))
+            self._notify(_write, sock)
         elif event.filter == select.KQ_FILTER_READ:
-            self.fire(_read(sock), self.getTarget(sock))
+            self._notify(_read, sock)
+
+
+class AsyncioPoller(BasePoller):
+    """
+    AsyncioPoller(loop=None, ...) -> new AsyncioPoller Poller Component
+
+    Creates a new Poller Component that uses an :mod:`asyncio` event loop
+    (``loop.add_reader()``, ``loop.add_writer()`` and ``loop.call_later()``)
+    to wait for I/O and timeouts. If no *loop* is given, the running loop
+    is used or a new one is created (a uvloop loop if uvloop is installed).
+
+    The root manager may be run as usual, the loop then runs while the
+    manager waits for new events. Or it may be run as a task of a running
+    loop with :meth:`serve`. Either way, asyncio tasks and circuits
+    components share a single thread and ``async def`` handlers may await
+    asyncio futures.
+    """
+
+    channel = 'asyncio'
+
+    def __init__(self, loop=None, channel=channel):
+        super().__init__(channel=channel)
+
+        self._loop = None
+        self._own_loop = False
+        self._event = None
+        self._waker = None
+        self._ready = set()
+
+        if loop is not None:
+            self._bind(loop)
+
+    def _create_control_con(self):
+        # resume() wakes up the loop with call_soon_threadsafe()
+        return None, None
+
+    def _bind(self, loop):
+        if loop is self._loop:
+            return
+
+        if self._loop is not None:
+            for fd in [] if self._paused else self._read:
+                self._loop.remove_reader(fd)
+            for fd in self._write:
+                self._loop.remove_writer(fd)
+
+        self._loop = loop
+        self._ctrl_pending = False
+        for fd in [] if self._paused else self._read:
+            loop.add_reader(fd, self._on_ready, _read, fd)
+        for fd in self._write:
+            loop.add_writer(fd, self._on_ready, _write, fd)
+
+    def _getLoop(self):
+        if self._loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+                self._own_loop = True
+            self._bind(loop)
+        return self._loop
+
+    @handler('stopped', channel='*')
+    def _on_stopped(self, manager):
+        # Close the loop created by this poller, a loop passed in or
+        # running already is left to its owner.
+        if manager is not self.root or not self._own_loop:
+            return
+
+        loop, self._loop = self._loop, None
+        self._own_loop = False
+        for fd in [] if self._paused else self._read:
+            loop.remove_reader(fd)
+        for fd in self._write:
+            loop.remove_writer(fd)
+        loop.close()
+
+    def addReader(self, source, fd):
+        super().addReader(source, fd)
+        if self._loop is not None and not self._paused:
+            self._loop.add_reader(fd, self._on_ready, _read, fd)
+
+    def addWriter(self, source, fd):
+        super().addWriter(source, fd)
+        if self._loop is not None:
+            self._loop.add_writer(fd, self._on_ready, _write, fd)
+
+    def removeReader(self, fd):
+        super().removeReader(fd)
+        if self._loop is not None and fd not in self._read:
+            self._loop.remove_reader(fd)
+
+    def removeWriter(self, fd):
+        super().removeWriter(fd)
+        if self._loop is not None and fd not in self._write:
+            self._loop.remove_writer(fd)
+
+    def _updateReading(self):
+        if self._loop is None:
+            return
+        for fd in self._read:
+            if self._paused:
+                self._loop.remove_reader(fd)
+            else:
+                self._loop.add_reader(fd, self._on_ready, _read, fd)
+
+    def discard(self, fd):
+        super().discard(fd)
+        if self._loop is not None:
+            with contextlib.suppress(ValueError, OSError):
+                self._loop.remove_reader(fd)
+            with contextlib.suppress(ValueError, OSError):
+                self._loop.remove_writer(fd)
+
+    def _on_ready(self, event, fd):
+        callbacks = self._callbacks.get(fd)
+        if callbacks is not None and callbacks[event] is not None:
+            self._notify(event, fd)
+            return
+
+        # The loop may invoke the callback again before the manager got to
+        # handle the event, fire it only once per wait.
+        key = (event, fd)
+        if key in self._ready:
+            return
+        self._ready.add(key)
+        self._fireEvent(event(fd), self.getTarget(fd))
+
+    def resume(self):
+        if self._loop is not None and not self._ctrl_pending:
+            self._ctrl_pending = True
+            try:
+                self._loop.call_soon_threadsafe(self._wake)
+            except RuntimeError:  # loop closed
+                self._ctrl_pending = False
+
+    def _wake(self):
+        self._ctrl_pending = False
+        waker = self._waker
+        if waker is not None and not waker.done():
+            waker.set_result(None)
+
+    def _generate_events(self, event):
+        loop = self._getLoop()
+        try:
+            running = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            running = False
+
+        if running:
+            # Called by serve(), which waits when the tick is done
+            self._event = event
+        else:
+            loop.run_until_complete(self._wait(event))
+
+    async def _wait(self, event):
+        root = self.root
+        loop = self._loop
+        self._ready.clear()
+        self._waker = loop.create_future()
+
+        # Events fired by callbacks while waiting must cut the wait short
+        root._waiting_in_loop = True
+
+        timeout = event.time_left
+        timer = loop.call_later(timeout, self._wake) if timeout > 0 else None
+        try:
+            if timeout == 0:
+                await asyncio.sleep(0)
+            else:
+                await self._waker
+        finally:
+            root._waiting_in_loop = False
+            self._waker = None
+            if timer is not None:
+                timer.cancel()
+
+    async def serve(self):
+        """
+        Run the root manager of this poller as a task of the running
+        asyncio event loop until the manager is stopped.
+        """
+        root = self.root
+        self._bind(asyncio.get_running_loop())
+
+        root._running = True
+        root._executing_thread = current_thread()
+        root.fire(started(root))
+
+        try:
+            while root.running or len(root._queue):
+                root.tick()
+
+                event, self._event = self._event, None
+                if event is None:
+                    await asyncio.sleep(0)
+                    continue
+
+                with root._lock:
+                    root._currently_handling = event
+                try:
+                    await self._wait(event)
+                finally:
+                    root._currently_handling = None
+
+            # Fading out, handle remaining work from stop event
+            for _ in range(3):
+                root.tick()
+        finally:
+            root._executing_thread = None
 
 
 Poller = Select
 
-__all__ = ('BasePoller', 'EPoll', 'KQueue', 'Poll', 'Poller', 'Select')
+__all__ = ('AsyncioPoller', 'BasePoller', 'EPoll', 'KQueue', 'Poll', 'Poller', 'Select')
@@ -3,8 +3,6 @@
 from datetime import datetime
 from time import mktime, time
 
-from circuits.core.handlers import handler
-
 from .components import BaseComponent
 
 
@@ -14,6 +12,9 @@ class Timer(BaseComponent):
 
     A timer is a component that fires an event once after a certain
     delay or periodically at a regular interval.
+
+    Timers do not poll: the expiry is scheduled with the root manager's
+    timer heap (see :meth:`~.manager.Manager.scheduleTimer`).
     """
 
     def __init__(self, interval, event, *channels, **kwargs):
@@ -37,6 +38,8 @@ class Timer(BaseComponent):
         """
         super().__init__()
 
+        self._timer = None
+
         self.expiry = None
         self.interval = None
         self.event = event
@@ -45,25 +48,33 @@ class Timer(BaseComponent):
 
         self.reset(interval)
 
-    @handler('generate_events')
-    def _on_generate_events(self, event):
-        if self.expiry is None:
-            return
+    def _expired(self):
+        self._timer = None
 
-        now = time()
+        if self.unregister_pending:
+            return
 
-        if now >= self.expiry:
-            if self.unregister_pending:
-                return
-            self.fire(self.event, *self.channels)
+        self.fire(self.event, *self.channels)
 
-            if self.persist:
-                self.reset()
-            else:
-                self.unregister()
-            event.reduce_time_left(0)
+        if self.persist:
+            self.reset()
         else:
-            event.reduce_time_left(self.expiry - now)
+            self.unregister()
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self.expiry is not None:
+            self._timer = self.root.scheduleTimer(self.expiry, self._expired)
+
+    def _updateRoot(self, root):
+        super()._updateRoot(root)
+
+        # Move the pending expiry to the new root's timer heap
+        if self._timer is not None:
+            self._schedule()
 
     def reset(self, interval=None):
         """
@@ -84,3 +95,4 @@ class Timer(BaseComponent):
     @expiry.setter
     def expiry(self, seconds):
         self._expiry = seconds
+        self._schedule()
@@ -18,6 +18,7 @@ class Value:
     :type  manager: A Manager/Component instance.
 
     :ivar result: True if this value has been changed.
+    :ivar done: True once all handlers of the event are done.
     :ivar errors: True if while setting this value an exception occurred.
     :ivar notify: True or an event name to notify of changes to this value
 
@@ -32,6 +33,7 @@ class Value:
         self.promise = False
 
         self.result = False
+        self.done = False
         self.errors = False
         self.parent = self
         self.handled = False
@@ -69,6 +71,16 @@ class Value:
         """x.__str__() <==> str(x)"""
         return str(self.value)
 
+    def __await__(self):
+        """
+        Wait for the event of this value to be done and return this
+        Value object, like ``await self.call(event)`` does. For use in
+        ``async def`` handlers, e.g. ``result = await self.fire(event)``.
+        """
+        if not self.done:
+            yield from self.manager.root._waitDone(self.event)
+        return self
+
     def inform(self, force=False):
         if self.promise and not force:
             return
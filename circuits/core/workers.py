@@ -10,14 +10,19 @@ Then fire `task()` events with a function and `*args` and `**kwargs` to pass
 to the function when called from within the workers.
 """
 
+from collections import deque
+from functools import partial
 from multiprocessing import Pool as ProcessPool, cpu_count
 from multiprocessing.pool import ThreadPool
+from queue import Full
 from threading import current_thread
+from time import time
 from weakref import WeakKeyDictionary
 
 from .components import BaseComponent
 from .events import Event
 from .handlers import handler
+from .manager import _State, _suspend
 
 
 DEFAULT_WORKERS = 10
@@ -59,13 +64,27 @@ class Worker(BaseComponent):
     and `task_failure` if it failed and threw an exception. The `task()` event
     can also be "waited" upon by using the `.call()` and `.wait()` primitives.
 
+    Handlers waiting for a task are suspended until the pool reports
+    completion; they are not polled.
+
     :param process: True to start this Worker as a process (Thread otherwise)
     :type process: bool
+
+    :param max_in_flight: Maximum number of tasks handed to the pool at
+                          the same time, further tasks are queued.
+                          **Default:** ``None`` (no limit)
+    :type max_in_flight: int
+
+    :param max_queued: Maximum number of tasks waiting for submission to
+                       the pool when ``max_in_flight`` is reached. If
+                       exceeded, the task fails with :class:`queue.Full`.
+                       **Default:** ``None`` (no limit)
+    :type max_queued: int
     """
 
     channel = 'worker'
 
-    def init(self, process=False, workers=None, channel=channel):
+    def init(self, process=False, workers=None, channel=channel, max_in_flight=None, max_queued=None):
         if not hasattr(current_thread(), '_children'):
             current_thread()._children = WeakKeyDictionary()
 
@@ -73,17 +92,71 @@ class Worker(BaseComponent):
         Pool = ProcessPool if process else ThreadPool
         self.pool = Pool(self.workers)
 
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+
+        self._in_flight = 0
+        self._queued = deque()
+
     @handler('stopped', 'unregistered', channel='*')
     def _on_stopped(self, event, *args):
         if event.name == 'unregistered' and args[0] is not self:
             return
 
+        # Hand over what is left, the pool completes it before joining
+        self.max_in_flight = None
+        self._submit()
+
         self.pool.close()
         self.pool.join()
 
+    @property
+    def in_flight(self):
+        """Number of tasks currently handed to the pool"""
+        return self._in_flight
+
+    @property
+    def queued(self):
+        """Number of tasks waiting to be handed to the pool"""
+        return len(self._queued)
+
     @handler('task')
     def _on_task(self, f, *args, **kwargs):
-        result = self.pool.apply_async(f, args, kwargs)
-        while not result.ready():
-            yield
-        yield result.get()
+        if self.max_queued is not None and len(self._queued) >= self.max_queued and not self._can_submit():
+            raise Full(f'Worker queue is full ({self.max_queued} tasks)')
+
+        # The task is resumed by the root it was fired in, even if this
+        # Worker is unregistered while the task is running.
+        state = _State()
+        self._queued.append((self.root, state, f, args, kwargs))
+        self._submit()
+
+        yield (yield _suspend(state))
+
+    def _done(self, root, state, value, error):
+        self._in_flight -= 1
+        self._submit()
+        root._resumeTask(state, value, error)
+
+    def _can_submit(self):
+        return self.max_in_flight is None or self._in_flight < self.max_in_flight
+
+    def _submit(self):
+        while self._queued and self._can_submit():
+            root, state, f, args, kwargs = self._queued.popleft()
+            self._in_flight += 1
+            self.pool.apply_async(
+                f,
+                args,
+                kwargs,
+                callback=partial(self._complete, root, state),
+                error_callback=partial(self._fail, root, state),
+            )
+
+    def _complete(self, root, state, value):
+        # Called from the pool's result thread, the timer is run by the
+        # main loop of root, which is woken up.
+        root.scheduleTimer(time(), self._done, root, state, value, None)
+
+    def _fail(self, root, state, error):
+        root.scheduleTimer(time(), self._done, root, state, None, error)
@@ -4,9 +4,17 @@ Networking Events
 This module implements commonly used Networking events used by socket components.
 """
 
+from socket import socket
+
 from circuits.core import Event
 
 
+def _connection(self):
+    # The origin of the events of a server connection (see Event.origin),
+    # so that the events of a socket are dispatched in order.
+    return self.args[0] if self.args and isinstance(self.args[0], socket) else None
+
+
 class connect(Event):
     """
     connect Event
@@ -29,6 +37,8 @@ class connect(Event):
         """x.__init__(...) initializes x; see x.__class__.__doc__ for signature"""
         super().__init__(*args, **kwargs)
 
+    origin = _connection
+
 
 class disconnect(Event):
     """
@@ -48,6 +58,8 @@ class disconnect(Event):
         """x.__init__(...) initializes x; see x.__class__.__doc__ for signature"""
         super().__init__(*args, **kwargs)
 
+    origin = _connection
+
 
 class connected(Event):
     """
@@ -102,6 +114,10 @@ class read(Event):
         """x.__init__(...) initializes x; see x.__class__.__doc__ for signature"""
         super().__init__(*args)
 
+    def origin(self):
+        # The connection of a server (or peer address of a UDP server)
+        return self.args[0] if len(self.args) > 1 else None
+
 
 class error(Event):
     """
@@ -120,6 +136,8 @@ class error(Event):
         """x.__init__(...) initializes x; see x.__class__.__doc__ for signature"""
         super().__init__(*args)
 
+    origin = _connection
+
 
 class unreachable(Event):
     """
@@ -178,6 +196,8 @@ class write(Event):
         """x.__init__(...) initializes x; see x.__class__.__doc__ for signature"""
         super().__init__(*args)
 
+    origin = _connection
+
 
 class close(Event):
     """
@@ -198,6 +218,8 @@ class close(Event):
         """x.__init__(...) initializes x; see x.__class__.__doc__ for signature"""
         super().__init__(*args)
 
+    origin = _connection
+
 
 class ready(Event):
     """
@@ -8,7 +8,7 @@ import contextlib
 import os
 import select
 from _socket import socket as SocketType
-from collections import defaultdict, deque
+from collections import deque
 from errno import (
     EAGAIN,
     EALREADY,
@@ -46,9 +46,11 @@ from socket import (
     socket,
 )
 from time import time
+from types import MappingProxyType
 
 from circuits.core import BaseComponent, handler
-from circuits.core.pollers import BasePoller, Poller
+from circuits.core.manager import _State, _suspend
+from circuits.core.pollers import BasePoller, Poller, _read as _readable
 from circuits.core.utils import findcmp
 
 from .events import close, closed, connect, connected, disconnect, disconnected, error, read, ready, unreachable, write
@@ -89,6 +91,15 @@ except ImportError:
 
 BUFSIZE = 4096  # 4KB Buffer
 BACKLOG = 5000  # 5K Concurrent Connections
+READ_BUDGET = 64  # Reads of an edge-triggered socket per read event
+ACCEPT_BUDGET = 64  # Connections accepted per readiness of a listening socket
+
+
+def _would_block(e):
+    """Return True if the socket error *e* means the call would block"""
+    if HAS_SSL and isinstance(e, SSLError):
+        return e.errno in (SSL_ERROR_WANT_READ, SSL_ERROR_WANT_WRITE)
+    return e.args[0] in (EWOULDBLOCK, EAGAIN)
 
 
 def wrap_socket(
@@ -160,6 +171,9 @@ class Client(BaseComponent):
     socket_protocol = IPPROTO_IP
     socket_options = []
 
+    drains = True
+    read_budget = READ_BUDGET
+
     def __init__(self, bind=None, bufsize=BUFSIZE, channel=channel, **kwargs):
         super().__init__(channel=channel, **kwargs)
 
@@ -216,7 +230,7 @@ class Client(BaseComponent):
     @handler('read_value_changed')
     def _on_read_value_changed(self, value):
         if isinstance(value, bytes):
-            self.fire(write(value))
+            self._fireEvent(write(value))
 
     @handler('prepare_unregister', channel='*')
     def _on_prepare_unregister(self, event, c):
@@ -248,35 +262,56 @@ class Client(BaseComponent):
             self._closeflag = True
 
     def _read(self):
-        try:
+        # An edge-triggered socket is not reported again until more data
+        # arrives, so read until it would block (or read_budget times, to
+        # be fair to other sockets) and deliver the data in one event.
+        edge = self._poller.isEdgeTriggered(self._sock)
+
+        chunks = []
+        eof = failure = None
+        for _ in range(self.read_budget if edge else 1):
             try:
                 data = self._ssock.read(self._bufsize) if self.secure and self._ssock else self._sock.recv(self._bufsize)
-            except SSLError as exc:
-                if exc.errno in (SSL_ERROR_WANT_READ, SSL_ERROR_WANT_WRITE):
-                    return
-                raise
+            except OSError as e:
+                if not _would_block(e):
+                    failure = e
+                break
+            if not data:
+                eof = True
+                break
+            chunks.append(data)
+        else:
+            if edge:
+                self._fireEvent(_readable(self._sock))
 
-            if data:
-                self.fire(read(data)).notify = True
-            else:
-                self.close()
-        except OSError as e:
-            if e.args[0] == EWOULDBLOCK:
-                return
-            self.fire(error(e))
+        if chunks:
+            event = read(b''.join(chunks))
+            event.notify = True
+            self._fireEvent(event)
+
+        if failure is not None:
+            self.fire(error(failure))
             self._close()
+        elif eof:
+            self.close()
 
     def _write(self, data):
+        # Return True if all of data has been written
         try:
             nbytes = self._ssock.write(data) if self.secure and self._ssock else self._sock.send(data)
 
             if nbytes < len(data):
                 self._buffer.appendleft(data[nbytes:])
+                return False
+            return True
         except OSError as e:
-            if e.args[0] in (EPIPE, ENOTCONN):
+            if _would_block(e):
+                self._buffer.appendleft(data)
+            elif e.args[0] in (EPIPE, ENOTCONN):
                 self._close()
             else:
                 self.fire(error(e))
+        return False
 
     @handler('write')
     def write(self, data):
@@ -284,6 +319,12 @@ class Client(BaseComponent):
             self._poller.addWriter(self, self._sock)
         self._buffer.append(data)
 
+    def _addReader(self, sock):
+        # The poller calls the readiness handlers directly, instead of
+        # firing _read, _write and _disconnect events
+        self._poller.addReader(self, sock)
+        self._poller.setCallbacks(sock, self.__on_read, self.__on_write, self.__on_disconnect)
+
     @handler('_disconnect', priority=1)
     def __on_disconnect(self, sock):
         self._close()
@@ -294,9 +335,12 @@ class Client(BaseComponent):
 
     @handler('_write', priority=1)
     def __on_write(self, sock):
-        if self._buffer:
-            data = self._buffer.popleft()
-            self._write(data)
+        # An edge-triggered socket is not reported again until it becomes
+        # writable again, so write until it would block.
+        edge = self._poller.isEdgeTriggered(self._sock)
+        while self._buffer:
+            if not self._write(self._buffer.popleft()) or not edge:
+                break
 
         if not self._buffer:
             if self._closeflag:
@@ -355,21 +399,39 @@ class TCPClient(Client):
                 self._close()
                 return
 
-        stop_time = time() + self.connect_timeout
-        while time() < stop_time:
-            try:
-                self._sock.getpeername()
-                self._connected = True
-                break
-            except Exception:
-                yield
+        try:
+            self._sock.getpeername()
+            self._connected = True
+        except OSError:
+            # Still connecting, suspend until the socket becomes writable
+            # (connected or failed) or the connect timeout expires.
+            sock = self._sock
+            state = _State()
+
+            def on_ready(fd=None):
+                timer.cancel()
+                self._poller.discard(sock)
+                try:
+                    sock.getpeername()
+                except OSError:
+                    self.root._resumeTask(state, False)
+                else:
+                    self.root._resumeTask(state, True)
+
+            self._poller.addWriter(self, sock)
+            self._poller.setCallbacks(sock, None, on_ready, on_ready)
+            timer = self.scheduleTimer(time() + self.connect_timeout, on_ready)
+            self._connected = yield _suspend(state)
 
         if not self._connected:
             self.fire(unreachable(host, port))
             return
 
         def on_done(sock):
-            self._poller.addReader(self, sock)
+            self._addReader(sock)
+            if self._buffer:
+                # Written while connecting
+                self._poller.addWriter(self, sock)
             self.fire(connected(host, port))
 
         if self.secure:
@@ -408,7 +470,7 @@ class UNIXClient(Client):
     @handler('ready')
     def ready(self, component):
         if self._poller is not None and self._connected:
-            self._poller.addReader(self, self._sock)
+            self._addReader(self._sock)
 
     @handler('connect')  # noqa
     def connect(self, path, secure=False, **kwargs):
@@ -437,7 +499,7 @@ class UNIXClient(Client):
 
         self._connected = True
 
-        self._poller.addReader(self, self._sock)
+        self._addReader(self._sock)
 
         if self.secure:
 
@@ -462,10 +524,40 @@ class UNIXClient(Client):
             self.fire(connected(gethostname(), path))
 
 
+class Connection:
+    """
+    The state of a connection of a :class:`Server`.
+
+    :ivar sock: the socket of the connection.
+    :ivar buffer: the data waiting to be written.
+    :ivar closing: True if the connection is closed once the buffer is written.
+    :ivar starttls: True if STARTTLS has been started on the connection.
+    :ivar bytes_read: the number of bytes read from the connection.
+    :ivar bytes_written: the number of bytes written to the connection.
+    """
+
+    __slots__ = ('buffer', 'bytes_read', 'bytes_written', 'closing', 'sock', 'starttls')
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = deque()
+        self.closing = False
+        self.starttls = False
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def __repr__(self):
+        return f'<Connection ({self.bytes_read} bytes read, {self.bytes_written} bytes written)>'
+
+
 class Server(BaseComponent):
     channel = 'server'
     socket_protocol = IPPROTO_IP
 
+    drains = True
+    read_budget = READ_BUDGET
+    accept_budget = ACCEPT_BUDGET
+
     def __init__(self, bind, secure=False, backlog=BACKLOG, bufsize=BUFSIZE, channel=channel, **kwargs):
         super().__init__(channel=channel)
 
@@ -480,12 +572,9 @@ class Server(BaseComponent):
         else:
             self._sock = self._create_socket()
 
-        self._closeq = []
-        self._clients = []
         self._poller = None
-        self._buffers = defaultdict(deque)
-
-        self.__starttls = set()
+        self._reserve = None
+        self._connections = {}
 
         self.secure = secure
         self.certfile = kwargs.get('certfile')
@@ -503,6 +592,14 @@ class Server(BaseComponent):
     def connected(self):
         return True
 
+    @property
+    def connections(self):
+        """
+        A read-only mapping of the sockets of the connections to their
+        :class:`Connection`.
+        """
+        return MappingProxyType(self._connections)
+
     @property
     def host(self):
         if getattr(self, '_sock', None) is not None:
@@ -531,7 +628,7 @@ class Server(BaseComponent):
         if self._poller is None:
             if isinstance(component, BasePoller):
                 self._poller = component
-                self._poller.addReader(self, self._sock)
+                self._addReader(self._sock)
                 self.fire(ready(self, (self.host, self.port)))
             else:
                 if component is not self:
@@ -539,7 +636,7 @@ class Server(BaseComponent):
                 component = findcmp(self.root, BasePoller)
                 if component is not None:
                     self._poller = component
-                    self._poller.addReader(self, self._sock)
+                    self._addReader(self._sock)
                     self.fire(ready(self, (self.host, self.port)))
                 else:
                     try:
@@ -547,7 +644,7 @@ class Server(BaseComponent):
                     except OSError as err:
                         self.fire(error(err))
                     else:
-                        self._poller.addReader(self, self._sock)
+                        self._addReader(self._sock)
                         self.fire(ready(self, (self.host, self.port)))
 
     @handler('stopped', channel='*')
@@ -558,27 +655,25 @@ class Server(BaseComponent):
     def _on_read_value_changed(self, value):
         if isinstance(value.value, bytes):
             sock = value.event.args[0]
-            self.fire(write(sock, value.value))
+            self._fireEvent(write(sock, value.value))
 
     def _close(self, sock):
         if sock is None:
             return
 
-        if sock != self._sock and sock not in self._clients:
+        conn = self._connections.pop(sock, None)
+        if conn is None and sock != self._sock:
             return
 
         self._poller.discard(sock)
 
-        if sock in self._buffers:
-            del self._buffers[sock]
-
-        if sock in self._clients:
-            self._clients.remove(sock)
+        if conn is not None:
+            conn.buffer.clear()
         else:
             self._sock = None
-
-        if sock in self.__starttls:
-            self.__starttls.remove(sock)
+            if self._reserve is not None:
+                os.close(self._reserve)
+                self._reserve = None
 
         with contextlib.suppress(OSError):
             sock.shutdown(2)
@@ -593,92 +688,159 @@ class Server(BaseComponent):
 
         if sock is None:
             socks = [self._sock]
-            socks.extend(self._clients[:])
+            socks.extend(self._connections)
         else:
             socks = [sock]
 
         for sock in socks:
-            if not self._buffers[sock]:
+            conn = self._connections.get(sock)
+            if conn is None or not conn.buffer:
                 self._close(sock)
-            elif sock not in self._closeq:
-                self._closeq.append(sock)
+            else:
+                conn.closing = True
 
         if is_closed:
             self.fire(closed())
 
     def _read(self, sock):
-        if sock not in self._clients:
+        conn = self._connections.get(sock)
+        if conn is None:
             return
 
-        try:
-            data = sock.recv(self._bufsize)
-            if data:
-                self.fire(read(sock, data)).notify = True
-            else:
-                self.close(sock)
-        except OSError as e:
-            if e.args[0] == EWOULDBLOCK:
-                return
-            self.fire(error(sock, e))
+        # See Client._read()
+        edge = self._poller.isEdgeTriggered(sock)
+
+        chunks = []
+        eof = failure = None
+        for _ in range(self.read_budget if edge else 1):
+            try:
+                data = sock.recv(self._bufsize)
+            except OSError as e:
+                if not _would_block(e):
+                    failure = e
+                break
+            if not data:
+                eof = True
+                break
+            chunks.append(data)
+        else:
+            if edge:
+                self._fireEvent(_readable(sock))
+
+        if chunks:
+            data = b''.join(chunks)
+            conn.bytes_read += len(data)
+            event = read(sock, data)
+            event.notify = True
+            self._fireEvent(event)
+
+        if failure is not None:
+            self.fire(error(sock, failure))
             self._close(sock)
+        elif eof:
+            self.close(sock)
 
     def _write(self, sock, data):
-        if sock not in self._clients:
-            return
+        # Return True if all of data has been written
+        conn = self._connections.get(sock)
+        if conn is None:
+            return False
 
         try:
             nbytes = sock.send(data)
+            conn.bytes_written += nbytes
             if nbytes < len(data):
-                self._buffers[sock].appendleft(data[nbytes:])
+                conn.buffer.appendleft(data[nbytes:])
+                return False
+            return True
         except OSError as e:
-            if e.args[0] not in (EINTR, EWOULDBLOCK, ENOBUFS):
+            if e.args[0] in (EINTR, ENOBUFS) or _would_block(e):
+                conn.buffer.appendleft(data)
+            else:
                 self.fire(error(sock, e))
                 self._close(sock)
-            else:
-                self._buffers[sock].appendleft(data)
+        return False
 
     @handler('write')
     def write(self, sock, data):
+        conn = self._connections.get(sock)
+        if conn is None:
+            return
         if not self._poller.isWriting(sock):
             self._poller.addWriter(self, sock)
-        self._buffers[sock].append(data)
+        conn.buffer.append(data)
 
     def _accept(self):
-        try:
-            newsock, _host = self._sock.accept()
-        except OSError as e:
-            if e.args[0] in (EWOULDBLOCK, EAGAIN):
-                return
-            elif e.args[0] == EPERM:
-                # Netfilter on Linux may have rejected the
-                # connection, but we get told to try to accept()
-                # anyway.
-                return
-            elif e.args[0] in (EMFILE, ENOBUFS, ENFILE, ENOMEM, ECONNABORTED):
-                # Linux gives EMFILE when a process is not allowed
-                # to allocate any more file descriptors.  *BSD and
-                # Win32 give (WSA)ENOBUFS.  Linux can also give
-                # ENFILE if the system is out of inodes, or ENOMEM
-                # if there is insufficient memory to allocate a new
-                # dentry.  ECONNABORTED is documented as possible on
-                # both Linux and Windows, but it is not clear
-                # whether there are actually any circumstances under
-                # which it can happen (one might expect it to be
-                # possible if a client sends a FIN or RST after the
-                # server sends a SYN|ACK but before application code
-                # calls accept(2), however at least on Linux this
-                # _seems_ to be short-circuited by syncookies.
-                return
-            else:
-                raise
+        # Accept the pending connections, up to accept_budget of them,
+        # and fire their connect events at once.
+        accepted = []
+        for _ in range(self.accept_budget):
+            try:
+                newsock, _host = self._sock.accept()
+            except OSError as e:
+                if e.args[0] in (EWOULDBLOCK, EAGAIN):
+                    break
+                elif e.args[0] in (EPERM, ECONNABORTED):
+                    # Netfilter on Linux may have rejected the
+                    # connection, but we get told to try to accept()
+                    # anyway.  ECONNABORTED is documented as possible on
+                    # both Linux and Windows, when the client gave up
+                    # before the connection was accepted.  Either way
+                    # the connection is gone, try the next one.
+                    continue
+                elif e.args[0] in (EMFILE, ENFILE) and self._reserve is not None:
+                    # Linux gives EMFILE when a process is not allowed
+                    # to allocate any more file descriptors, and ENFILE
+                    # if the system is out of inodes.  The connection
+                    # stays pending and the listening socket readable,
+                    # so close the spare descriptor to accept and drop
+                    # it, instead of being woken up for it over and
+                    # over again.
+                    self._dropConnection()
+                    continue
+                elif e.args[0] in (EMFILE, ENOBUFS, ENFILE, ENOMEM):
+                    # *BSD and Win32 give (WSA)ENOBUFS.  Linux can also
+                    # give ENOMEM if there is insufficient memory to
+                    # allocate a new dentry.
+                    break
+                else:
+                    raise
+
+            # Like accept4(2) with SOCK_NONBLOCK
+            newsock.setblocking(False)
+            accepted.append(newsock)
+        else:
+            if self._poller.isEdgeTriggered(self._sock):
+                # The listening socket is not reported again for
+                # connections that are already pending.
+                self._fireEvent(_readable(self._sock))
 
         if self.secure and HAS_SSL:
-            for _ in self._do_handshake(newsock):
-                yield
+            for newsock in accepted:
+                for _ in self._do_handshake(newsock):
+                    yield
+        elif accepted:
+            events = []
+            for newsock in accepted:
+                self._addClient(newsock)
+                event = self._connectEvent(newsock)
+                if event is not None:
+                    events.append(event)
+            self.fireEvents(events)
+
+    def _dropConnection(self):
+        os.close(self._reserve)
+        self._reserve = None
+        try:
+            newsock, _host = self._sock.accept()
+        except OSError:
+            pass
         else:
-            self._on_accept_done(newsock)
+            newsock.close()
+        with contextlib.suppress(OSError):
+            self._reserve = os.open(os.devnull, os.O_RDONLY)
 
-    def _do_handshake(self, sock, fire_connect_event=True):
+    def _do_handshake(self, sock, fire_connect_event=True, conn=None):
         sslsock = wrap_socket(
             sock,
             self.keyfile,
@@ -691,18 +853,32 @@ class Server(BaseComponent):
             do_handshake_on_connect=False,
         )
 
-        yield from do_handshake(sslsock, self._on_accept_done, self._on_handshake_error, (fire_connect_event,))
+        yield from do_handshake(sslsock, self._on_accept_done, self._on_handshake_error, (fire_connect_event, conn))
 
-    def _on_accept_done(self, sock, fire_connect_event=True):
+    def _on_accept_done(self, sock, fire_connect_event=True, conn=None):
         sock.setblocking(False)
-        self._poller.addReader(self, sock)
-        self._clients.append(sock)
+        self._addClient(sock, conn)
         if fire_connect_event:
-            try:
-                self.fire(connect(sock, *sock.getpeername()))
-            except OSError as exc:
-                # errno 107 (ENOTCONN): the client already disconnected
-                self._on_handshake_error(sock, exc)
+            event = self._connectEvent(sock)
+            if event is not None:
+                self.fire(event)
+
+    def _addClient(self, sock, conn=None):
+        # conn is the Connection of a socket that started TLS
+        if conn is None:
+            conn = Connection(sock)
+        else:
+            conn.sock = sock
+        self._connections[sock] = conn
+        self._addReader(sock)
+
+    def _connectEvent(self, sock):
+        try:
+            return connect(sock, *sock.getpeername())
+        except OSError as exc:
+            # errno 107 (ENOTCONN): the client already disconnected
+            self._on_handshake_error(sock, exc)
+        return None
 
     def _on_handshake_error(self, sock, err):
         self.fire(error(sock, err))
@@ -712,14 +888,29 @@ class Server(BaseComponent):
     def starttls(self, sock):
         if not HAS_SSL:
             raise RuntimeError('Cannot start TLS. No TLS support.')
-        if sock in self.__starttls:
+        conn = self._connections[sock]
+        if conn.starttls:
             raise RuntimeError('Cannot reuse socket for already started STARTTLS.')
-        self.__starttls.add(sock)
+        conn.starttls = True
         self._poller.removeReader(sock)
-        self._clients.remove(sock)
-        for _ in self._do_handshake(sock, False):
+        # The TLS socket takes the place of sock once the handshake is
+        # done, data buffered for sock is not written.
+        del self._connections[sock]
+        conn.buffer.clear()
+        for _ in self._do_handshake(sock, False, conn):
             yield
 
+    def _addReader(self, sock):
+        # See Client._addReader(). Accepting stays on the event path, as
+        # it may continue in a task (for TLS handshakes).
+        self._poller.addReader(self, sock)
+        if sock is not self._sock:
+            self._poller.setCallbacks(sock, self._read, self._on_write, self._on_disconnect)
+        elif self._reserve is None:
+            # A spare descriptor to accept connections with when out of
+            # descriptors (see _accept())
+            self._reserve = os.open(os.devnull, os.O_RDONLY)
+
     @handler('_disconnect', priority=1)
     def _on_disconnect(self, sock):
         self._close(sock)
@@ -733,13 +924,17 @@ class Server(BaseComponent):
 
     @handler('_write', priority=1)
     def _on_write(self, sock):
-        if self._buffers[sock]:
-            data = self._buffers[sock].popleft()
-            self._write(sock, data)
+        conn = self._connections.get(sock)
+        buffer = conn.buffer if conn is not None else ()
+
+        # See Client.__on_write()
+        edge = self._poller.isEdgeTriggered(sock)
+        while buffer:
+            if not self._write(sock, buffer.popleft()) or not edge:
+                break
 
-        if not self._buffers[sock]:
-            if sock in self._closeq:
-                self._closeq.remove(sock)
+        if not buffer:
+            if conn is not None and conn.closing:
                 self._close(sock)
             elif self._poller.isWriting(sock):
                 self._poller.removeWriter(sock)
@@ -833,11 +1028,16 @@ class UDPServer(Server):
         (SOL_SOCKET, SO_REUSEADDR, 1),
     ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # The state of the socket, its buffer holds (address, data) pairs
+        self._conn = Connection(self._sock)
+
     def _close(self, sock):
         self._poller.discard(sock)
 
-        if sock in self._buffers:
-            del self._buffers[sock]
+        self._conn.buffer.clear()
 
         with contextlib.suppress(OSError):
             sock.shutdown(2)
@@ -850,43 +1050,64 @@ class UDPServer(Server):
     def close(self):
         self.fire(closed())
 
-        if self._buffers[self._sock] and self._sock not in self._closeq:
-            self._closeq.append(self._sock)
+        if self._conn.buffer and not self._conn.closing:
+            self._conn.closing = True
         else:
             self._close(self._sock)
 
     def _read(self):
-        try:
-            data, address = self._sock.recvfrom(self._bufsize)
-            if data:
-                self.fire(read(address, data)).notify = True
-        except OSError as e:
-            if e.args[0] in (EWOULDBLOCK, EAGAIN):
+        # Like Server._read() but with a read event for each datagram
+        edge = self._poller.isEdgeTriggered(self._sock)
+
+        for _ in range(self.read_budget if edge else 1):
+            try:
+                data, address = self._sock.recvfrom(self._bufsize)
+            except OSError as e:
+                if not _would_block(e):
+                    self.fire(error(self._sock, e))
+                    self._close(self._sock)
                 return
-            self.fire(error(self._sock, e))
-            self._close(self._sock)
+            if data:
+                self._conn.bytes_read += len(data)
+                event = read(address, data)
+                event.notify = True
+                self._fireEvent(event)
+
+        if edge:
+            self._fireEvent(_readable(self._sock))
 
     def _write(self, address, data):
+        # Return True if all of data has been written
         try:
             bytes = self._sock.sendto(data, address)
+            self._conn.bytes_written += bytes
             if bytes < len(data):
-                self._buffers[self._sock].appendleft(data[bytes:])
+                self._conn.buffer.appendleft((address, data[bytes:]))
+                return False
+            return True
         except OSError as e:
-            if e.args[0] in (EPIPE, ENOTCONN):
+            if _would_block(e):
+                self._conn.buffer.appendleft((address, data))
+            elif e.args[0] in (EPIPE, ENOTCONN):
                 self._close(self._sock)
             else:
                 self.fire(error(self._sock, e))
+        return False
 
     @handler('write', override=True)
     def write(self, address, data):
         if not self._poller.isWriting(self._sock):
             self._poller.addWriter(self, self._sock)
-        self._buffers[self._sock].append((address, data))
+        self._conn.buffer.append((address, data))
 
     @handler('broadcast', override=True)
     def broadcast(self, data, port):
         self.write(('<broadcast>', port), data)
 
+    def _addReader(self, sock):
+        self._poller.addReader(self, sock)
+        self._poller.setCallbacks(sock, self._on_read, self._on_write, self._on_disconnect)
+
     @handler('_disconnect', priority=1, override=True)
     def _on_disconnect(self, sock):
         self._close(sock)
@@ -897,13 +1118,16 @@ class UDPServer(Server):
 
     @handler('_write', priority=1, override=True)
     def _on_write(self, sock):
-        if self._buffers[self._sock]:
-            address, data = self._buffers[self._sock].popleft()
-            self._write(address, data)
+        # See Client.__on_write()
+        edge = self._poller.isEdgeTriggered(self._sock)
+        buffer = self._conn.buffer
+        while buffer:
+            if not self._write(*buffer.popleft()) or not edge:
+                break
 
-        if not self._buffers[self._sock]:
-            if self._sock in self._closeq:
-                self._closeq.remove(self._sock)
+        if not buffer:
+            if self._conn.closing:
+                self._conn.closing = False
                 self._close(self._sock)
             elif self._poller.isWriting(self._sock):
                 self._poller.removeWriter(self._sock)
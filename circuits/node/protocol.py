@@ -1,5 +1,6 @@
 from circuits import Component, handler
 from circuits.core import Value
+from circuits.core.manager import _State, _suspend
 from circuits.net.events import write
 
 from .utils import dump_event, dump_value, load_event, load_value
@@ -16,6 +17,7 @@ class Protocol(Component):
     def init(self, sock=None, server=None, **kwargs):
         self.__server = server
         self.__sock = sock
+        self.__states = {}
         self.__receive_event_firewall = kwargs.get('receive_event_firewall', None)
         self.__send_event_firewall = kwargs.get('send_event_firewall', None)
 
@@ -52,9 +54,11 @@ class Protocol(Component):
             self.__send(packet)
 
             if not getattr(event, 'node_without_result', False):
+                # Suspended until the result is received
+                state = _State()
                 self.__events[id] = event
-                while not hasattr(self.__events[id], 'remote_finish'):
-                    yield
+                self.__states[id] = state
+                yield _suspend(state)
 
                 del self.__events[id]
                 yield event.value
@@ -117,3 +121,8 @@ class Protocol(Component):
 
             for k, v in meta.items():
                 setattr(ev, k, v)
+
+            # Resume send(), unless it is not run as a task of the manager
+            state = self.__states.pop(id, None)
+            if state is not None and state.task is not None:
+                self.root._resumeTask(state, ev.value)
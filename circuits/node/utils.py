@@ -1,9 +1,9 @@
 import json
 
-from circuits.core import Event
+from circuits.core import Event, LightEvent
 
 
-META_EXCLUDE = set(dir(Event()))
+META_EXCLUDE = set(dir(Event())) | set(dir(LightEvent()))
 META_EXCLUDE.add('node_call_id')
 META_EXCLUDE.add('node_sock')
 META_EXCLUDE.add('node_without_result')
@@ -40,7 +40,7 @@ def dump_event(e, id):
         'id': id,
         'name': e.name,
         'args': e.args,
-        'kwargs': e.kwargs,
+        'kwargs': dict(e.kwargs),
         'success': e.success,
         'failure': e.failure,
         'channels': e.channels,
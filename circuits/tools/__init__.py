@@ -207,6 +207,54 @@ def inspect(x):
     return ''.join(s)
 
 
+def stats(x, limit=20):
+    """
+    Display a report of the handler timings recorded by the
+    instrumentation of the Component or Manager x's root manager
+    (see :meth:`~circuits.core.manager.Manager.setInstrumentation`)
+
+    :param x: A Component or Manager to report on
+    :type  x: Component or Manager
+
+    :param limit: The maximum number of handlers and events listed
+    :type  limit: int
+
+    @return: A report of the handlers taking the most time, and of the
+             events waiting the longest in the queue
+    @rtype:  str
+    """
+    instrumentation = x.instrumentation
+    if instrumentation is None:
+        return ' Instrumentation is disabled\n'
+
+    s = []
+    write = s.append
+
+    def row(name, h):
+        write(
+            '  %-40s %8d %10.3f %10.3f %10.3f %10.3f %10.3f\n'
+            % (name, h.calls, h.total * 1e3, h.mean * 1e3, h.percentile(50) * 1e3, h.percentile(99) * 1e3, h.max * 1e3)
+        )
+
+    header = '  %-40s %8s %10s %10s %10s %10s %10s\n'
+    columns = ('Calls', 'Total ms', 'Mean ms', 'p50 ms', 'p99 ms', 'Max ms')
+
+    write(' Handlers (1/%d sampled): %d\n' % (instrumentation.sample, len(instrumentation.handlers)))
+    write(header % ('Event: Handler', *columns))
+    handlers = sorted(instrumentation.handlers.items(), key=lambda item: item[1].total, reverse=True)
+    for (event, handler), h in handlers[:limit]:
+        row(f'{event}: {handler}', h)
+    write('\n')
+
+    write(' Queue Wait: %d\n' % len(instrumentation.queue_wait))
+    write(header % ('Event', *columns))
+    events = sorted(instrumentation.queue_wait.items(), key=lambda item: item[1].max, reverse=True)
+    for event, h in events[:limit]:
+        row(event, h)
+
+    return ''.join(s)
+
+
 def deprecated(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
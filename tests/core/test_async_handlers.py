@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+from time import time
+
+import pytest
+
+from circuits import Component, Event, TimeoutError, handler, sleep
+from circuits.core.values import Value
+
+
+class call(Event):
+    """call Event"""
+
+    success = True
+
+
+class wait(Event):
+    """wait Event"""
+
+    success = True
+
+
+class fire(Event):
+    """fire Event"""
+
+    success = True
+
+
+class same(Event):
+    """same Event"""
+
+    success = True
+
+
+class late(Event):
+    """late Event"""
+
+    success = True
+
+
+class nap(Event):
+    """nap Event"""
+
+    success = True
+
+
+class timeout(Event):
+    """timeout Event"""
+
+    success = True
+
+
+class fail(Event):
+    """fail Event"""
+
+    failure = True
+
+
+class hello(Event):
+    """hello Event"""
+
+    success = True
+
+
+class foo(Event):
+    """foo Event"""
+
+    success = True
+
+
+class App(Component):
+    @handler('call')
+    async def _on_call(self):
+        x = await self.call(hello())
+        y = await self.call(foo())
+        return [x.value, y.value]
+
+    @handler('wait')
+    async def _on_wait(self):
+        x = self.fire(hello())
+        await self.wait('hello')
+        return x.value
+
+    @handler('fire')
+    async def _on_fire(self):
+        return await self.fire(foo())
+
+    @handler('same')
+    async def _on_same(self):
+        x = await self.fire(hello())
+        y = await self.call(hello())
+        return [isinstance(x, Value), isinstance(y, Value), x.value, y.value]
+
+    @handler('late')
+    async def _on_late(self):
+        x = self.fire(hello())
+        await self.call(foo())
+        assert x.done
+        return (await x).value
+
+    @handler('nap')
+    async def _on_nap(self, seconds):
+        start = time()
+        await sleep(seconds)
+        return time() - start
+
+    @handler('timeout')
+    async def _on_timeout(self):
+        try:
+            await self.wait('never', timeout=0.1)
+        except TimeoutError as e:
+            return e
+
+    @handler('fail')
+    async def _on_fail(self):
+        await self.call(hello())
+        raise ValueError('failed')
+
+    def hello(self):
+        return 'Hello World!'
+
+    def foo(self):
+        yield from range(1, 4)
+
+
+@pytest.fixture()
+def app(request, manager, watcher):
+    app = App().register(manager)
+    assert watcher.wait('registered')
+
+    def finalizer():
+        app.unregister()
+
+    request.addfinalizer(finalizer)
+
+    return app
+
+
+def test_call(manager, watcher, app):
+    x = manager.fire(call())
+    assert watcher.wait('call_success')
+
+    assert x.value == ['Hello World!', [1, 2, 3]]
+
+
+def test_wait(manager, watcher, app):
+    x = manager.fire(wait())
+    assert watcher.wait('wait_success')
+
+    assert x.value == 'Hello World!'
+
+
+def test_fire(manager, watcher, app):
+    x = manager.fire(fire())
+    assert watcher.wait('fire_success')
+
+    assert x.value == [1, 2, 3]
+
+
+def test_fire_and_call_await_value(manager, watcher, app):
+    x = manager.fire(same())
+    assert watcher.wait('same_success')
+
+    assert x.value == [True, True, 'Hello World!', 'Hello World!']
+
+
+def test_await_done(manager, watcher, app):
+    x = manager.fire(late())
+    assert watcher.wait('late_success')
+
+    assert x.value == 'Hello World!'
+
+
+def test_sleep(manager, watcher, app):
+    x = manager.fire(nap(0.1))
+    assert watcher.wait('nap_success')
+
+    assert x.value >= 0.1
+
+
+def test_timeout(manager, watcher, app):
+    x = manager.fire(timeout())
+    assert watcher.wait('timeout_success')
+
+    assert isinstance(x.value, TimeoutError)
+
+
+def test_failure(manager, watcher, app):
+    x = manager.fire(fail())
+    assert watcher.wait('fail_failure')
+
+    assert x.errors
+    assert x.value[0] is ValueError
+
+
+def test_suspended_coroutine_is_not_polled():
+    app = App()
+    while len(app):
+        app.flush()
+
+    app.fire(nap(0.2))
+    app.tick()
+    app.tick()
+
+    assert not app._tasks
+    assert len(app._timers) == 1
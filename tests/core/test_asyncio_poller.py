@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+import asyncio
+from threading import Thread
+from time import sleep
+
+from circuits import Component, Event, Manager
+from circuits.core.pollers import AsyncioPoller
+
+
+class fetch(Event):
+    """fetch Event"""
+
+    success = True
+
+
+class ping(Event):
+    """ping Event"""
+
+
+class App(Component):
+    def init(self):
+        self.pinged = False
+
+    async def fetch(self, future):
+        await asyncio.sleep(0.01)
+        return await future
+
+    def fetch_success(self, *args):
+        self.root.stop()
+
+    def ping(self):
+        self.pinged = True
+        self.root.stop()
+
+
+def test_serve():
+    async def main():
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        loop.call_later(0.1, future.set_result, 'Hello World!')
+
+        poller = AsyncioPoller()
+        m = Manager() + poller
+        App().register(m)
+        x = m.fire(fetch(future))
+
+        await asyncio.wait_for(poller.serve(), 5)
+        return x.value
+
+    assert asyncio.run(main()) == 'Hello World!'
+
+
+def test_serve_wakeup():
+    async def main():
+        loop = asyncio.get_running_loop()
+        poller = AsyncioPoller()
+        m = Manager() + poller
+        app = App().register(m)
+
+        # Fired by an asyncio callback and by another thread while waiting
+        loop.call_later(0.1, m.fire, Event.create('noop'))
+        loop.call_later(0.2, lambda: Thread(target=m.fire, args=(ping(),)).start())
+
+        await asyncio.wait_for(poller.serve(), 5)
+        return app.pinged
+
+    assert asyncio.run(main())
+
+
+def test_run():
+    m = Manager() + AsyncioPoller()
+    app = App().register(m)
+    m.start()
+
+    m.fire(ping())
+    for _ in range(50):
+        if app.pinged:
+            break
+        sleep(0.1)
+
+    assert app.pinged
+
+
+def test_run_callback_wakeup():
+    poller = AsyncioPoller()
+    m = Manager() + poller
+    app = App().register(m)
+    m.start()
+    for _ in range(50):
+        if poller._waker is not None:
+            break
+        sleep(0.1)
+    threads = []
+
+    def callback():
+        # Run by the loop in the thread of the manager while waiting
+        threads.append(m._executing_thread)
+        m.fire(ping())
+
+    loop = poller._loop
+    loop.call_soon_threadsafe(callback)
+    for _ in range(50):
+        if app.pinged and not m.running:
+            break
+        sleep(0.1)
+
+    assert app.pinged
+    assert len(threads) == 1
+    assert threads[0] is not None
+
+    for _ in range(50):
+        if loop.is_closed():
+            break
+        sleep(0.1)
+    assert loop.is_closed()
+    assert poller._loop is None
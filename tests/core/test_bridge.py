@@ -4,6 +4,7 @@ from os import getpid
 import pytest
 
 from circuits import Component, Event, ipc
+from circuits.core.events import LightEvent
 
 
 pytestmark = pytest.mark.skipif(pytest.PLATFORM == 'win32', reason='Unsupported Platform')
@@ -15,10 +16,19 @@ class hello(Event):
     """hello Event"""
 
 
+class ping(LightEvent):
+    """ping LightEvent"""
+
+    __slots__ = ()
+
+
 class App(Component):
     def hello(self):
         return f'Hello from {getpid():d}'
 
+    def ping(self):
+        return f'Pong from {getpid():d}'
+
 
 def test(manager, watcher):
     app = App()
@@ -31,6 +41,10 @@ def test(manager, watcher):
 
     assert x.value == f'Hello from {app.pid:d}'
 
+    y = manager.fire(ipc(ping()))
+    assert pytest.wait_for(y, 'result')
+    assert y.value == f'Pong from {app.pid:d}'
+
     app.stop()
     app.join()
 
@@ -4,7 +4,7 @@ from time import sleep, time
 
 import pytest
 
-from circuits.core import Component, Event, Worker, handler, task
+from circuits.core import Component, Event, Manager, Worker, handler, task
 
 
 class hello(Event):
@@ -53,3 +53,42 @@ def test_call_order(manager, watcher, app):
     value = x.value
 
     assert value == 1
+
+
+class greet(Event):
+    """greet Event"""
+
+    success = True
+    complete = True
+
+
+class Greeter(Component):
+    def init(self):
+        self.log = []
+
+    @handler('hello')
+    def _on_hello(self):
+        yield self.call(greet())
+        self.log.append('resumed')
+
+    def greet(self):
+        self.log.append('greet')
+
+    def greet_success(self, e, value):
+        self.log.append('greet_success')
+
+    def greet_complete(self, e, value):
+        self.log.append('greet_complete')
+
+
+def test_resume_after_followups():
+    m = Manager()
+    app = Greeter().register(m)
+    while len(m):
+        m.flush()
+
+    m.fire(hello())
+    for _ in range(10):
+        m.tick(0)
+
+    assert app.log == ['greet', 'greet_success', 'greet_complete', 'resumed']
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+from time import time
+
 import pytest
 
 from circuits.core import Component, Event, TimeoutError, handler
@@ -95,3 +97,37 @@ def test_call_failure(manager, watcher, app):
     value = x.value
 
     assert isinstance(value, TimeoutError)
+
+
+class slow(Event):
+    """slow Event"""
+
+    success = True
+
+
+class Waiter(Component):
+    @handler('slow')
+    def _on_slow(self, timeout):
+        try:
+            yield self.wait('never', timeout=timeout)
+        except TimeoutError as e:
+            yield e
+
+
+def test_wait_timeout_seconds():
+    m = Waiter()
+    x = m.fire(slow(0.2))
+    m.tick()
+    m.tick()
+
+    handlers = dict(m._handlers)
+    assert 'never' in m._waiters
+
+    start = time()
+    while not x.result and time() - start < 5:
+        m.tick()
+
+    assert isinstance(x.value, TimeoutError)
+    assert time() - start >= 0.15
+    assert m._handlers == handlers
+    assert not m._waiters
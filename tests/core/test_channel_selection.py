@@ -62,3 +62,27 @@ def test():
     m.flush()
     m.flush()
     assert x.value == 'Bar'
+
+
+def test_handler_index():
+    m = Manager()
+    a = A().register(m)
+    b = B().register(m)
+
+    while len(m):
+        m.flush()
+
+    assert m.getHandlers(foo(), 'a') == {a.foo}
+    assert m.getHandlers(foo(), 'b') == {b.foo}
+    assert m.getHandlers(foo(), '*') == {a.foo, b.foo}
+    assert m.getHandlers(foo(), 'c') == set()
+
+    # The index follows changes to the channel of the component
+    b.channel = 'c'
+    assert m.getHandlers(foo(), 'c') == {b.foo}
+
+    # and handlers added or removed later on
+    b.removeHandler(b.foo)
+    assert m.getHandlers(foo(), 'c') == set()
+    b.addHandler(B.foo)
+    assert m.getHandlers(foo(), 'c') == {b.foo}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+from threading import Thread
+
+from circuits import Component, Event, Manager
+from circuits.core.pollers import _write
+
+
+class refresh(Event):
+    """refresh Event"""
+
+    def coalesce(self):
+        return self.args[0]
+
+
+class App(Component):
+    def init(self):
+        self.refreshed = []
+
+    def refresh(self, view):
+        self.refreshed.append(view)
+        return view
+
+
+def test_coalesce():
+    m = Manager()
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    x = m.fire(refresh('a'))
+    y = m.fire(refresh('b'))
+    z = m.fire(refresh('a'))
+    assert len(m) == 2
+    assert z is x
+
+    m.flush()
+    assert app.refreshed == ['a', 'b']
+    assert x.value == 'a'
+    assert y.value == 'b'
+    assert m.coalesced['refresh'] == 1
+
+
+def test_coalesce_channels():
+    m = Manager()
+    m.fire(refresh('a'), 'foo')
+    m.fire(refresh('a'), 'bar')
+    assert len(m) == 2
+
+
+def test_coalesce_after_flush():
+    m = Manager()
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    m.fire(refresh('a'))
+    m.flush()
+    m.fire(refresh('a'))
+    m.flush()
+
+    assert app.refreshed == ['a', 'a']
+    assert not m.coalesced
+
+
+def test_coalesce_from_thread():
+    m = Manager()
+    thread = Thread(target=m.fireEvents, args=([refresh('a') for _ in range(10)],))
+    thread.start()
+    thread.join()
+
+    assert len(m) == 1
+    assert m.coalesced['refresh'] == 9
+
+
+def test_write_readiness():
+    m = Manager()
+    m._fireEvent(_write(4))
+    m._fireEvent(_write(4))
+    m._fireEvent(_write(5))
+
+    assert len(m) == 2
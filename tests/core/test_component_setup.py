@@ -1,4 +1,4 @@
-from circuits import Component, Manager
+from circuits import BaseComponent, Component, Manager
 from circuits.core.handlers import handler
 
 
@@ -87,3 +87,55 @@ def test_subclassing_with_custom_channel():
     c = C()
 
     assert c.channel == 'c'
+
+
+class D(App):
+    child = A()
+
+    @handler('test')
+    def _on_test(self, *args, **kwargs):
+        pass
+
+
+def test_handler_table_reused():
+    d1 = D()
+    d2 = D()
+
+    assert D.__dict__['_handler_table'] is D._handlerTable()
+    assert d1._on_test in d1._handlers['test']
+    assert d1.App_test in d1._handlers['test']
+    assert d2._on_test in d2._handlers['test']
+    assert d1._on_test not in d2._handlers['test']
+    assert D.child.parent is d2
+
+
+class E(BaseComponent):
+    def __init__(self, greeting):
+        @handler('hello')
+        def hello(self):
+            return greeting
+
+        self.hello = hello
+        super().__init__()
+
+
+def test_instance_handlers():
+    e = E('Hello World!')
+
+    assert e.hello in e._handlers['hello']
+    assert e.hello() == 'Hello World!'
+
+
+def test_handler_added_later():
+    class F(BaseComponent):
+        pass
+
+    F()
+    hello = handler('hello')(lambda self: 'Hello World!')
+    F.hello = hello
+
+    # The handler table of F is not rebuilt, add the handler to instances
+    f = F()
+    assert 'hello' not in f._handlers
+    method = f.addHandler(hello)
+    assert method in f._handlers['hello']
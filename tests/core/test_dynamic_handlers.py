@@ -54,3 +54,54 @@ def test_removeHandler():
     assert 'foo' not in m._handlers
 
     m.stop()
+
+
+class bar(Event):
+    """bar Event"""
+
+
+@handler('bar')
+def on_bar(self):
+    return 'Hello Bar!'
+
+
+def test_partial_cache_invalidation():
+    m = Manager()
+
+    m.fire(foo())
+    m.fire(bar())
+    m.flush()
+
+    assert 'foo' in m._cache
+    assert 'bar' in m._cache
+
+    m.addHandler(on_bar)
+    m.fire(foo())
+    m.flush()
+
+    assert 'foo' in m._cache
+    assert 'bar' not in m._cache
+
+    x = m.fire(bar())
+    m.flush()
+
+    assert x.value == 'Hello Bar!'
+
+
+def test_wildcard_cache_invalidation():
+    m = Manager()
+
+    m.fire(foo())
+    m.flush()
+
+    assert 'foo' in m._cache
+
+    @handler(channel='*')
+    def on_any(self, event, *args, **kwargs):
+        return event.name
+
+    m.addHandler(on_any)
+    m.fire(bar())
+    m.flush()
+
+    assert 'foo' not in m._cache
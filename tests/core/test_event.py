@@ -1,18 +1,31 @@
 """Event Tests"""
 
+import pickle
+
 import pytest
 
-from circuits import Component, Event
+from circuits import Component, Event, LightEvent
 
 
 class test(Event):
     """test Event"""
 
 
+class light(LightEvent):
+    """light Event"""
+
+    __slots__ = ()
+
+    success = True
+
+
 class App(Component):
     def test(self):
         return 'Hello World!'
 
+    def light(self, *args):
+        return sum(args)
+
 
 def test_repr():
     app = App()
@@ -90,3 +103,48 @@ def test_subclass_looses_properties():
 
     e = hello().child('success')
     assert e.success is False
+
+
+def test_create_reuses_class():
+    a = Event.create('test_interned', 1)
+    b = Event.create('test_interned', 2)
+
+    assert type(a) is type(b)
+    assert a.args == [1]
+    assert b.args == [2]
+    assert type(test.create('test_interned')) is not type(a)
+
+
+def test_child_reuses_class():
+    e = test()
+
+    a = e.child('success')
+    b = e.child('success')
+
+    assert type(a) is type(b)
+    assert a.name == 'test_success'
+    assert a.parent is e
+    assert type(a) is type(Event.create('test_success'))
+
+
+def test_light_event():
+    app = App()
+    while len(app):
+        app.flush()
+
+    e = light(1, 2)
+    assert e.name == 'light'
+    assert e.args == (1, 2)
+    assert not hasattr(e, '__dict__')
+    pytest.raises(AttributeError, setattr, e, 'foo', 'bar')
+
+    x = app.fire(e)
+    assert repr(e) == '<light[*] (1, 2 )>'
+    app.flush()
+    assert x.value == 3
+
+    e = pickle.loads(pickle.dumps(light(1, 2, foo='bar')))
+    assert type(e) is light
+    assert e.args == (1, 2)
+    assert e.kwargs == {'foo': 'bar'}
+    assert e.value is None
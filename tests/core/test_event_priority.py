@@ -43,3 +43,20 @@ def test2():
     app.run()
 
     assert app.results == [2, 1]
+
+
+def test3():
+    app = App()
+
+    # Priority Order, FIFO within the same priority
+    app.fire(foo(1), priority=1)
+    app.fire(foo(2), priority=-1)
+    app.fire(foo(3))
+    app.fire(foo(4), priority=1)
+    app.fire(foo(5), priority=-1)
+    app.fire(foo(6))
+    app.fire(done(), priority=2)
+
+    app.run()
+
+    assert app.results == [2, 5, 3, 6, 1, 4]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+import pytest
+
+from circuits import Component, Event, Manager
+
+
+class hello(Event):
+    """hello Event"""
+
+
+class App(Component):
+    channel = '*'
+
+    def init(self):
+        self.received = []
+
+    def hello(self, source, n):
+        self.received.append((source, n))
+
+
+def setup():
+    m = Manager()
+    app = App().register(m)
+    a = Component(channel='a').register(m)
+    b = Component(channel='b').register(m)
+    while len(m):
+        m.flush()
+
+    for n in range(4):
+        a.fire(hello('a', n))
+    for n in range(2):
+        b.fire(hello('b', n))
+
+    return m, app
+
+
+def test_fifo():
+    m, app = setup()
+    m.flush()
+
+    assert [source for source, _ in app.received] == ['a', 'a', 'a', 'a', 'b', 'b']
+
+
+def test_fair():
+    m, app = setup()
+    m.setFairScheduling()
+    m.flush()
+
+    assert app.received == [('a', 0), ('b', 0), ('a', 1), ('b', 1), ('a', 2), ('a', 3)]
+
+
+def test_budget():
+    m, app = setup()
+    m.setFairScheduling(budget=2)
+    m.flush()
+
+    assert app.received == [('a', 0), ('b', 0), ('a', 1), ('b', 1)]
+    assert len(m) == 2
+
+    m.fire(hello('c', 0))
+    m.flush()
+    assert app.received[4:] == [('a', 2), ('c', 0), ('a', 3)]
+
+
+def test_fair_of_root():
+    m, app = setup()
+    app.setFairScheduling(budget=2)
+    assert m._queue.fair
+    assert m._queue.budget == 2
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        Manager().setFairScheduling(budget=0)
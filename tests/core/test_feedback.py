@@ -12,6 +12,10 @@ class test(Event):
     failure = True
 
 
+class plain(Event):
+    """plain Event"""
+
+
 class App(Component):
     def __init__(self):
         super().__init__()
@@ -33,6 +37,14 @@ class App(Component):
 
         return 'Hello World!'
 
+    def plain(self):
+        return 'Hello World!'
+
+    def plain_success(self, e, value):
+        self.e = e
+        self.value = value
+        self.success = True
+
     def test_success(self, e, value):
         self.e = e
         self.value = value
@@ -98,3 +110,27 @@ def test_failure():
     assert app.failure
     assert not app.success
     assert app.e.value == x
+
+
+def test_instance_success():
+    app = App()
+    while len(app):
+        app.flush()
+
+    # Dispatch once without feedback, then ask for it on the instance
+    app.fire(plain())
+    while len(app):
+        app.flush()
+    assert not app.success
+
+    e = plain()
+    e.success = True
+    value = app.fire(e)
+
+    while len(app):
+        app.flush()
+
+    assert value.value == 'Hello World!'
+    assert app.e == e
+    assert app.success
+    assert app.value == 'Hello World!'
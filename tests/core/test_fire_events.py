@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+import select
+from threading import Thread
+
+import pytest
+
+from circuits import Component, Event, Manager
+from circuits.core.pollers import Select
+
+
+class hello(Event):
+    """hello Event"""
+
+
+class App(Component):
+    channel = 'app'
+
+    def init(self):
+        self.received = []
+
+    def hello(self, n):
+        self.received.append(n)
+        return n
+
+
+def test_fire_events():
+    m = Manager()
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    events = [hello(n) for n in range(3)]
+    m.fireEvents(events, 'app')
+    # The values are created by the caller, not by the main loop
+    values = [e._value for e in events]
+    assert all(value is not None and value.manager is m for value in values)
+    m.flush()
+
+    assert app.received == [0, 1, 2]
+    assert [e.value.value for e in events] == [0, 1, 2]
+
+
+def test_fire_events_from_thread(manager, watcher):
+    app = App().register(manager)
+    assert watcher.wait('registered')
+
+    events = [hello(n) for n in range(100)]
+    thread = Thread(target=manager.fireEvents, args=(events, 'app'))
+    thread.start()
+    thread.join()
+    values = [e._value for e in events]
+
+    assert pytest.wait_for(app, 'received', list(range(100)))
+    assert [value.value for value in values] == list(range(100))
+
+    app.unregister()
+
+
+def test_resume_coalesced():
+    poller = Select()
+
+    poller.resume()
+    poller.resume()
+
+    assert poller._read_ctrl() == b'\0'
+    assert not select.select([poller._ctrl_recv], [], [], 0)[0]
+
+    poller.resume()
+    assert select.select([poller._ctrl_recv], [], [], 0)[0]
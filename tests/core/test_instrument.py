@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+from threading import Thread
+
+import pytest
+
+from circuits import Component, Event, Manager
+from circuits.core import instrument
+from circuits.core.instrument import Histogram, Instrumentation
+
+
+class hello(Event):
+    """hello Event"""
+
+
+class count(Event):
+    """count Event"""
+
+
+class ask(Event):
+    """ask Event"""
+
+
+class App(Component):
+    def hello(self):
+        return 'Hello World!'
+
+    def count(self):
+        yield 1
+        yield 2
+
+    def ask(self):
+        yield self.call(hello())
+
+
+def test_histogram():
+    h = Histogram()
+    for duration in (0.001, 0.001, 0.002, 0.3):
+        h.add(duration)
+
+    assert h.calls == 4
+    assert h.max == 0.3
+    assert h.mean == pytest.approx(0.076)
+    assert h.percentile(50) == 0.001
+    assert h.percentile(75) == 0.0025
+    assert h.percentile(100) == 0.3
+
+
+def test_instrumentation():
+    m = Manager()
+    App().register(m)
+    while len(m):
+        m.flush()
+
+    instrumentation = m.setInstrumentation()
+    assert m.instrumentation is instrumentation
+
+    m.fire(hello())
+    m.fire(count())
+    while len(m) or m._tasks:
+        m.tick(0)
+
+    assert instrumentation.handlers[('hello', 'App.hello')].calls == 1
+    # The call and three steps, the last one ending the generator
+    assert instrumentation.handlers[('count', 'App.count')].calls == 4
+    assert instrumentation.queue_wait['hello'].calls == 1
+
+    m.setInstrumentation(False)
+    assert m.instrumentation is None
+
+
+def test_delegated_steps():
+    m = Manager()
+    App().register(m)
+    while len(m):
+        m.flush()
+
+    instrumentation = m.setInstrumentation()
+    m.fire(ask())
+    while len(m) or m._tasks:
+        m.tick(0)
+
+    assert [name for _, name in instrumentation.handlers] == ['App.ask', 'App.hello']
+    assert instrumentation.handlers[('ask', 'App.ask')].calls > 1
+
+
+def test_of_root():
+    m = Manager()
+    app = App().register(m)
+    instrumentation = app.setInstrumentation()
+    assert m.instrumentation is instrumentation
+    assert app.instrumentation is instrumentation
+
+
+def test_bounded_stamps(monkeypatch):
+    monkeypatch.setattr(instrument, 'MAX_STAMPS', 4)
+    instrumentation = Instrumentation()
+    events = [hello() for _ in range(6)]
+    for event in events:
+        instrumentation.fired(event)
+
+    assert list(instrumentation._stamps) == events[2:]
+
+
+def test_from_thread():
+    m = Manager()
+    instrumentation = m.setInstrumentation()
+
+    thread = Thread(target=m.fireEvents, args=([hello() for _ in range(3)],))
+    thread.start()
+    thread.join()
+    m.flush()
+
+    assert instrumentation.queue_wait['hello'].calls == 3
+
+
+def test_sample():
+    m = Manager()
+    App().register(m)
+    while len(m):
+        m.flush()
+
+    instrumentation = m.setInstrumentation(sample=10)
+    for _ in range(100):
+        m.fire(hello())
+    m.flush()
+
+    assert instrumentation.handlers[('hello', 'App.hello')].calls == 10
+    assert instrumentation.queue_wait['hello'].calls == 10
+
+    for _ in range(10):
+        m.fire(count())
+    while len(m) or m._tasks:
+        m.tick(0)
+
+    # The call and three steps of one generator
+    assert instrumentation.handlers[('count', 'App.count')].calls == 4
+
+    instrumentation.reset()
+    assert not instrumentation.handlers
+
+
+def test_invalid_sample():
+    with pytest.raises(ValueError):
+        Instrumentation(0)
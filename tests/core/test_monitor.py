@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+from time import sleep, time
+
+from circuits import Component, Event, LoopMonitor, Manager
+
+
+class block(Event):
+    """block Event"""
+
+
+class App(Component):
+    def init(self):
+        self.lags = []
+
+    def block(self, seconds):
+        sleep(seconds)
+
+    def loop_lag(self, metric, value, threshold):
+        self.lags.append((metric, value, threshold))
+
+
+def test_monitor():
+    m = Manager()
+    app = App().register(m)
+    monitor = LoopMonitor(busy=0.05, queue=2).register(m)
+    assert m._monitor is monitor
+
+    m.fire(block(0.1))
+    m.tick(0)
+    m.tick(0)
+
+    metrics = [metric for metric, _, _ in app.lags]
+    assert 'busy' in metrics
+    assert 'queue' in metrics
+    assert monitor.percentile('busy', 100) >= 0.1
+    assert monitor.stats()['tick']['max'] >= 0.1
+
+
+def test_timer_lag():
+    m = Manager()
+    app = App().register(m)
+    monitor = LoopMonitor(lag=0.05).register(m)
+
+    m.scheduleTimer(time() - 0.1, lambda: None)
+    m.tick(0)
+    m.tick(0)
+
+    assert monitor.percentile('lag', 50) >= 0.1
+    assert [metric for metric, _, _ in app.lags] == ['lag']
+
+
+def test_poll():
+    m = Manager()
+    monitor = LoopMonitor().register(m)
+    m._running = True
+    try:
+        m.tick(0.1)
+    finally:
+        m._running = False
+
+    assert monitor.percentile('poll', 50) >= 0.05
+
+
+def test_unregister():
+    m = Manager()
+    monitor = LoopMonitor().register(m)
+    while len(m):
+        m.flush()
+
+    monitor.unregister()
+    while len(m):
+        m.flush()
+    assert m._monitor is None
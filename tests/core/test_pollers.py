@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+import select
+import socket
+
+import pytest
+
+from circuits import Component, Manager
+from circuits.core.events import generate_events
+from circuits.core.pollers import EPoll, Poll, Select
+
+
+POLLERS = [Poll] + ([EPoll] if hasattr(select, 'epoll') else [])
+
+
+class App(Component):
+    def init(self):
+        self.errors = []
+
+    def exception(self, *args, **kwargs):
+        self.errors.append(args[1])
+
+
+@pytest.fixture()
+def sockets():
+    a, b = socket.socketpair()
+    yield a, b
+    a.close()
+    b.close()
+
+
+@pytest.mark.parametrize('Poller', POLLERS)
+def test_modify(Poller, sockets):
+    a, _ = sockets
+    poller = Poller()
+    m = Manager()
+
+    poller.addReader(m, a)
+    fileno, mask = poller._registered[a]
+    assert fileno == a.fileno()
+
+    for _ in range(3):
+        poller.addWriter(m, a)
+        assert poller._registered[a][1] != mask
+        poller.removeWriter(a)
+        assert poller._registered[a][1] == mask
+
+    assert poller.isReading(a)
+    assert not poller.isWriting(a)
+
+
+@pytest.mark.parametrize('Poller', POLLERS)
+def test_discard_closed(Poller, sockets):
+    a, b = sockets
+    poller = Poller()
+    m = Manager()
+
+    poller.addReader(m, a)
+    poller.addWriter(m, a)
+    fileno = a.fileno()
+    a.close()
+
+    poller.discard(a)
+    assert a not in poller._registered
+    assert fileno not in poller._map
+    assert not poller.isReading(a)
+    assert poller.getTarget(a) is poller.parent
+
+
+@pytest.mark.parametrize('Poller', [Select, *POLLERS])
+def test_callbacks(Poller, sockets):
+    a, b = sockets
+    m = Manager()
+    poller = Poller().register(m)
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    ready = []
+    poller.addReader(m, a)
+    poller.addWriter(m, a)
+    poller.setCallbacks(a, read=lambda fd: ready.append(('read', fd)), write=lambda fd: ready.append(('write', fd)))
+
+    b.send(b'x')
+    poller._generate_events(generate_events(m._lock, 0))
+    assert sorted(ready) == [('read', a), ('write', a)]
+    assert not len(m)
+
+    def fail(fd):
+        raise ValueError(fd)
+
+    poller.setCallbacks(a, read=fail)
+    poller._generate_events(generate_events(m._lock, 0))
+    # Without a write callback, a _write event is fired
+    assert sorted(event.name for _, event, _ in m._queue._queue) == ['_write', 'exception']
+    m.flush()
+    assert [type(e) for e in app.errors] == [ValueError]
+
+    # The callbacks are forgotten with the descriptor
+    poller.discard(a)
+    poller.addReader(m, a)
+    assert a not in poller._callbacks
+    poller.discard(a)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+import select
+import socket
+from queue import Full
+from threading import Event as Event_, Thread
+
+import pytest
+
+from circuits import Component, Event, Manager
+from circuits.core.events import generate_events
+from circuits.core.pollers import EPoll, Poll, Select
+
+
+POLLERS = [Select, Poll] + ([EPoll] if hasattr(select, 'epoll') else [])
+
+
+class hello(Event):
+    """hello Event"""
+
+
+class slow(Event):
+    """slow Event"""
+
+
+class Gate(Component):
+    def init(self, gate):
+        self.gate = gate
+
+    def slow(self):
+        self.gate.wait(5)
+
+
+class App(Component):
+    def init(self):
+        self.events = []
+
+    def queue_pressure(self, queued):
+        self.events.append(('pressure', queued))
+
+    def queue_relief(self, queued):
+        self.events.append(('relief', queued))
+
+
+def test_pressure_and_relief():
+    m = Manager()
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    m.setQueueLimits(4, 2)
+    for _ in range(4):
+        m.fire(hello())
+    m.tick(0)
+    assert app.events == [('pressure', 4)]
+    assert m._queue_pressure
+
+    m.tick(0)
+    assert app.events == [('pressure', 4), ('relief', 0)]
+    assert not m._queue_pressure
+
+
+def test_remove_limits():
+    m = Manager()
+    app = App().register(m)
+    m.setQueueLimits(1)
+    m.tick(0)
+    assert m._queue_pressure
+
+    m.setQueueLimits(None)
+    m.flush()
+    assert not m._queue_pressure
+    assert [name for name, _ in app.events] == ['pressure', 'relief']
+
+
+def test_limits_of_root():
+    m = Manager()
+    app = App().register(m)
+    app.setQueueLimits(4, 2, 'raise')
+    assert (m._queue_high, m._queue_low, m._queue_overflow) == (4, 2, 'raise')
+    assert app._queue_high is None
+
+
+def test_invalid_limits():
+    m = Manager()
+    with pytest.raises(ValueError):
+        m.setQueueLimits(4, 4)
+    with pytest.raises(ValueError):
+        m.setQueueLimits(4, overflow='drop')
+
+
+def test_overflow_raise():
+    m = Manager()
+    m.setQueueLimits(2, 0, overflow='raise')
+    m.fire(hello())
+    m.fire(hello())
+    assert m._queue_pressure
+
+    # The dispatching thread is never refused
+    m.tick(0)
+    m.fire(hello())
+
+    errors = []
+
+    def fire():
+        try:
+            m.fire(hello())
+        except Full as e:
+            errors.append(e)
+
+    thread = Thread(target=fire)
+    thread.start()
+    thread.join()
+    assert errors
+
+
+def test_overflow_block(manager, watcher):
+    gate = Event_()
+    app = Gate(gate).register(manager)
+    assert watcher.wait('registered')
+
+    manager.setQueueLimits(1, 0, overflow='block')
+    try:
+        manager.fire(slow())
+        assert manager._queue_pressure
+
+        thread = Thread(target=manager.fire, args=(hello(),))
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+
+        gate.set()
+        assert watcher.wait('queue_relief')
+        thread.join(1)
+        assert not thread.is_alive()
+    finally:
+        gate.set()
+        manager.setQueueLimits(None)
+        app.unregister()
+
+
+def queued(m):
+    return [event.name for _, event, _ in m._queue._queue]
+
+
+@pytest.mark.parametrize('Poller', POLLERS)
+def test_poller_paused(Poller):
+    m = Manager()
+    poller = Poller().register(m)
+    while len(m):
+        m.flush()
+
+    a, b = socket.socketpair()
+    try:
+        poller.addReader(m, a)
+        b.send(b'x')
+
+        m.setQueueLimits(1)
+        m.fire(hello())
+        m.tick(0)
+        assert poller._paused
+        assert poller.isReading(a)
+
+        poller._generate_events(generate_events(m._lock, 0))
+        assert '_read' not in queued(m)
+
+        m.setQueueLimits(None)
+        m.flush()
+        assert not poller._paused
+
+        poller._generate_events(generate_events(m._lock, 0))
+        assert '_read' in queued(m)
+    finally:
+        poller.discard(a)
+        a.close()
+        b.close()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+from time import time
+
+from circuits import Component, Event, sleep
+
+
+class nap(Event):
+    """nap Event"""
+
+    success = True
+
+
+class App(Component):
+    def init(self):
+        self.woken = None
+
+    def nap(self, seconds):
+        yield sleep(seconds)
+        self.woken = time()
+        yield 'Refreshed'
+
+
+def test_sleeping_task_is_not_polled():
+    app = App()
+    while len(app):
+        app.flush()
+
+    app.fire(nap(0.2))
+    app.tick()
+    app.tick()
+
+    assert not app._tasks
+    assert len(app._timers) == 1
+    assert app.woken is None
+
+
+def test_sleep():
+    app = App()
+    while len(app):
+        app.flush()
+
+    start = time()
+    v = app.fire(nap(0.1))
+    while not v.result and time() - start < 5:
+        app.tick()
+
+    assert v.value == 'Refreshed'
+    assert app.woken - start >= 0.1
+    assert not app._timers
@@ -7,7 +7,7 @@ from time import time
 
 import pytest
 
-from circuits import Component, Event, Timer, sleep
+from circuits import Component, Event, Manager, Timer, sleep
 
 
 @pytest.fixture()
@@ -80,3 +80,28 @@ def test_datetime(app, watcher):
     Timer(d, single()).register(app)
     assert watcher.wait('single_complete')
     assert app.flag
+
+
+def test_cancel(app, watcher):
+    timer = Timer(0.1, single()).register(app)
+    assert watcher.wait('registered')
+    timer.unregister()
+    assert watcher.wait('unregistered')
+
+    assert not pytest.wait_for(app, 'flag', timeout=0.3)
+
+
+def test_schedule_timer():
+    m = Manager()
+    calls = []
+
+    now = time()
+    m.scheduleTimer(now + 0.05, calls.append, 2)
+    m.scheduleTimer(now, calls.append, 1)
+    m.scheduleTimer(now, calls.append, 3).cancel()
+
+    while len(calls) < 2 and time() - now < 5:
+        m.tick()
+
+    assert calls == [1, 2]
+    assert not m._timers
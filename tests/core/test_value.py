@@ -123,3 +123,23 @@ def test_multiple_values(app, simple_manager):
     assert x[0] == 'foo'
     assert x[1] == 'bar'
     assert x[2] == 'Hello World!'
+
+
+def test_lazy_value():
+    app = App()
+    while len(app):
+        app.flush()
+
+    # No Value unless a handler returns something
+    ev = Event.create('nothing')
+    app._fireEvent(ev)
+    app.flush()
+    assert ev._value is None
+
+    ev = hello()
+    ev.notify = True
+    app._fireEvent(ev)
+    app.flush()
+    app.flush()
+    assert ev.value.value == 'Hello World!'
+    assert app.value is ev.value
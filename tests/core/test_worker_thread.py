@@ -1,8 +1,11 @@
 """Workers Tests"""
 
+from queue import Full
+from threading import Event
+
 import pytest
 
-from circuits import Worker, task
+from circuits import LoopMonitor, Worker, task
 
 
 task.complete = True
@@ -49,3 +52,68 @@ def test_args(manager, watcher, worker):
 
     assert x.result
     assert x.value == 3
+
+
+def fail():
+    raise ValueError('Oops')
+
+
+def test_failure(manager, watcher, worker):
+    x = manager.fire(task(fail))
+    assert watcher.wait('task_failure')
+
+    assert x.errors
+    assert isinstance(x.value[1], ValueError)
+
+
+def test_bounded(manager, watcher):
+    release = Event()
+    worker = Worker(max_in_flight=1, max_queued=1, channel='bounded').register(manager)
+    assert watcher.wait('registered')
+
+    x = manager.fire(task(release.wait), 'bounded')
+    y = manager.fire(task(add, 1, 2), 'bounded')
+    z = manager.fire(task(add, 3, 4), 'bounded')
+
+    assert pytest.wait_for(worker, 'queued', 1)
+    assert watcher.wait('task_failure')
+    assert worker.in_flight == 1
+    assert isinstance(z.value[1], Full)
+
+    release.set()
+    assert pytest.wait_for(y, 'value', 3)
+    assert x.value is True
+
+    worker.unregister()
+    assert watcher.wait('unregistered')
+
+
+def test_unregister_in_flight(manager, watcher):
+    release = Event()
+    worker = Worker(channel='leaving').register(manager)
+    assert watcher.wait('registered')
+
+    x = manager.fire(task(release.wait), 'leaving')
+    assert pytest.wait_for(worker, 'in_flight', 1)
+
+    worker.unregister()
+    release.set()
+    assert watcher.wait('unregistered')
+    assert pytest.wait_for(x, 'result')
+    assert x.value is True
+
+
+def test_monitor_lag(manager, watcher, worker):
+    monitor = LoopMonitor(lag=None).register(manager)
+    assert watcher.wait('registered')
+
+    x = manager.fire(task(add, 1, 2))
+    assert watcher.wait('task_complete')
+    assert x.value == 3
+
+    # Completions are run on the next tick, not reported as late timers
+    assert monitor.samples['lag']
+    assert monitor.percentile('lag', 100) < 1
+
+    monitor.unregister()
+    assert watcher.wait('unregistered')
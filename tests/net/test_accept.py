@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+import socket
+from errno import EMFILE
+
+import pytest
+
+from circuits import Manager
+from circuits.core.pollers import Select
+from circuits.net.sockets import TCPServer
+
+
+class Exhausted:
+    """Listening socket out of descriptors on the first accept()"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self.sock, name)
+
+    def accept(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise OSError(EMFILE, 'Too many open files')
+        return self.sock.accept()
+
+
+@pytest.fixture()
+def server():
+    m = Manager() + Select()
+    server = TCPServer(('127.0.0.1', 0)).register(m)
+    while len(m):
+        m.flush()
+    yield server
+    server._close(server._sock)
+    for sock in list(server.connections):
+        server._close(sock)
+
+
+def connections(server, n):
+    return [socket.create_connection((server.host, server.port)) for _ in range(n)]
+
+
+def queued(server):
+    return [event.name for _, event, _ in server.root._queue._queue]
+
+
+def test_accept_batch(server):
+    clients = connections(server, 10)
+    try:
+        for _ in server._accept():
+            pass
+        assert len(server.connections) == 10
+        assert all(not sock.getblocking() for sock in server.connections)
+        assert queued(server).count('connect') == 10
+    finally:
+        for sock in clients:
+            sock.close()
+
+
+def test_accept_budget(server):
+    server.accept_budget = 4
+    clients = connections(server, 10)
+    try:
+        for _ in server._accept():
+            pass
+        assert len(server.connections) == 4
+    finally:
+        for sock in clients:
+            sock.close()
+
+
+def test_accept_out_of_descriptors(server):
+    assert server._reserve is not None
+
+    server._sock = Exhausted(server._sock)
+    (client,) = connections(server, 1)
+    try:
+        for _ in server._accept():
+            pass
+        assert not server.connections
+        assert server._reserve is not None
+
+        # The connection has been accepted and dropped
+        client.settimeout(5)
+        assert client.recv(1) == b''
+    finally:
+        client.close()
+        server._sock = server._sock.sock
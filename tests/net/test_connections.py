@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+import socket
+
+import pytest
+
+from circuits import Component, Manager
+from circuits.core.pollers import Select
+from circuits.net.events import close, write
+from circuits.net.sockets import TCPServer
+
+
+class Echo(Component):
+    channel = 'server'
+
+    def init(self):
+        self.ready = False
+        self.host = self.port = None
+        self.clients = []
+        self.disconnected = []
+
+    def ready(self, server, bind):
+        self.host, self.port = bind
+        self.ready = True
+
+    def connect(self, sock, *args):
+        self.clients.append(sock)
+
+    def disconnect(self, sock):
+        self.disconnected.append(sock)
+
+    def read(self, sock, data):
+        return data
+
+
+@pytest.fixture()
+def server():
+    m = Manager() + Select()
+    tcp_server = TCPServer(('127.0.0.1', 0))
+    server = Echo() + tcp_server
+    server.register(m)
+    m.start()
+    assert pytest.wait_for(server, 'ready')
+    yield tcp_server, server
+    server.fire(close())
+    m.stop()
+
+
+def test_connections(server):
+    tcp_server, app = server
+    client = socket.create_connection((app.host, app.port))
+    try:
+        assert pytest.wait_for(tcp_server, 'connections', lambda obj, attr: len(obj.connections) == 1)
+        (sock,) = tcp_server.connections
+        with pytest.raises(TypeError):
+            tcp_server.connections[sock] = None
+
+        client.sendall(b'hello')
+        assert client.recv(5) == b'hello'
+
+        conn = tcp_server.connections[sock]
+        assert conn.sock is sock
+        assert pytest.wait_for(conn, 'bytes_written', 5)
+        assert conn.bytes_read == 5
+    finally:
+        client.close()
+
+    assert pytest.wait_for(tcp_server, 'connections', lambda obj, attr: not obj.connections)
+
+
+def test_close_after_write(server):
+    tcp_server, app = server
+    client = socket.create_connection((app.host, app.port))
+    try:
+        assert pytest.wait_for(app, 'clients', lambda obj, attr: obj.clients)
+        (sock,) = app.clients
+
+        tcp_server.fire(write(sock, b'bye'))
+        tcp_server.fire(close(sock))
+        assert pytest.wait_for(app, 'disconnected', [sock])
+        assert client.recv(3) == b'bye'
+        assert not tcp_server.connections
+    finally:
+        client.close()
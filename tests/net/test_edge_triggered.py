@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+import select
+import socket
+
+import pytest
+
+from circuits import Component, Manager
+from circuits.core.pollers import EPoll
+from circuits.net.events import close, connect, write
+from circuits.net.sockets import TCPClient, TCPServer
+
+
+pytestmark = pytest.mark.skipif(not hasattr(select, 'epoll'), reason='No epoll support')
+
+
+class Source:
+    channel = 'source'
+    drains = True
+
+
+class Echo(Component):
+    channel = 'server'
+
+    def init(self):
+        self.reads = 0
+        self.connects = 0
+        self.ready = False
+        self.host = self.port = None
+
+    def ready(self, server, bind):
+        self.host, self.port = bind
+        self.ready = True
+
+    def connect(self, sock, *args):
+        self.connects += 1
+
+    def read(self, sock, data):
+        self.reads += 1
+        return data
+
+
+class Receiver(Component):
+    channel = 'client'
+
+    def init(self):
+        self.data = b''
+        self.connected = False
+
+    def connected(self, host, port):
+        self.connected = True
+
+    def read(self, data):
+        self.data += data
+
+
+def test_registration():
+    m = Manager()
+    poller = EPoll(edge_triggered=True).register(m)
+    a, b = socket.socketpair()
+    try:
+        poller.addReader(Source(), a)
+        poller.addReader(m, b)
+
+        assert poller.isEdgeTriggered(a)
+        assert poller._registered[a][1] & select.EPOLLET
+        assert not poller.isEdgeTriggered(b)
+        assert not poller._registered[b][1] & select.EPOLLET
+        assert not poller.isEdgeTriggered(poller._ctrl_recv)
+
+        poller.discard(a)
+        assert not poller.isEdgeTriggered(a)
+    finally:
+        poller.discard(b)
+        a.close()
+        b.close()
+
+
+def test_level_triggered_by_default():
+    m = Manager()
+    poller = EPoll().register(m)
+    a, b = socket.socketpair()
+    try:
+        poller.addReader(Source(), a)
+        assert not poller.isEdgeTriggered(a)
+    finally:
+        poller.discard(a)
+        a.close()
+        b.close()
+
+
+def test_echo():
+    m = Manager() + EPoll(edge_triggered=True)
+    server = Echo() + TCPServer(0)
+    client = Receiver() + TCPClient()
+    server.register(m)
+    client.register(m)
+    m.start()
+
+    try:
+        assert pytest.wait_for(server, 'ready')
+        client.fire(connect(server.host, server.port))
+        assert pytest.wait_for(client, 'connected')
+
+        payload = bytes(range(256)) * 4096
+        client.fire(write(payload))
+        assert pytest.wait_for(client, 'data', payload)
+
+        # Reads are batched into fewer events than recv() calls
+        assert server.reads < len(payload) // 4096
+
+        client.fire(close())
+    finally:
+        m.stop()
+
+
+def test_read_budget():
+    m = Manager() + EPoll(edge_triggered=True)
+    tcp_server = TCPServer(0, bufsize=4)
+    tcp_server.read_budget = 2
+    server = Echo() + tcp_server
+    server.register(m)
+    m.start()
+
+    sock = None
+    try:
+        assert pytest.wait_for(server, 'ready')
+        sock = socket.create_connection((server.host, server.port))
+        sock.sendall(b'x' * 64)
+
+        received = b''
+        while len(received) < 64:
+            received += sock.recv(64)
+        assert received == b'x' * 64
+        assert server.reads >= 8
+    finally:
+        if sock is not None:
+            sock.close()
+        m.stop()
+
+
+def test_accept_pending():
+    m = Manager() + EPoll(edge_triggered=True)
+    server = Echo() + TCPServer(0)
+    server.register(m)
+    m.start()
+
+    socks = []
+    try:
+        assert pytest.wait_for(server, 'ready')
+        socks = [socket.create_connection((server.host, server.port)) for _ in range(5)]
+        assert pytest.wait_for(server, 'connects', 5)
+    finally:
+        for sock in socks:
+            sock.close()
+        server.fire(close())
+        m.stop()
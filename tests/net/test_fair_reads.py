@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+import socket
+
+from circuits import Component, Manager
+from circuits.core.pollers import Select
+from circuits.net.sockets import TCPServer
+
+
+class App(Component):
+    channel = 'server'
+
+    def init(self):
+        self.received = []
+
+    def read(self, sock, data):
+        self.received.append((sock, data))
+
+    def disconnect(self, sock):
+        self.received.append((sock, None))
+
+
+def test_fair_reads():
+    m = Manager() + Select()
+    server = TCPServer(('127.0.0.1', 0)).register(m)
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    clients = [socket.create_connection((server.host, server.port)) for _ in range(2)]
+    try:
+        for _ in server._accept():
+            pass
+        assert len(server.connections) == 2
+        a, b = server.connections
+        while len(m):
+            m.flush()
+
+        # Wait for the data in recv()
+        a.settimeout(5)
+        b.settimeout(5)
+
+        client_a = next(c for c in clients if c.getsockname() == a.getpeername())
+        client_b = next(c for c in clients if c.getsockname() == b.getpeername())
+        for data in (b'a1', b'a2', b'a3'):
+            client_a.sendall(data)
+            server._read(a)
+        client_b.sendall(b'b1')
+        server._read(b)
+
+        m.setFairScheduling()
+        m.flush()
+        assert app.received == [(a, b'a1'), (b, b'b1'), (a, b'a2'), (a, b'a3')]
+    finally:
+        for sock in clients:
+            sock.close()
+        server._close(server._sock)
+        for sock in list(server.connections):
+            server._close(sock)
+
+
+def test_read_before_disconnect():
+    m = Manager() + Select()
+    server = TCPServer(('127.0.0.1', 0)).register(m)
+    app = App().register(m)
+    while len(m):
+        m.flush()
+
+    client = socket.create_connection((server.host, server.port))
+    try:
+        for _ in server._accept():
+            pass
+        (sock,) = server.connections
+        sock.settimeout(5)
+        while len(m):
+            m.flush()
+
+        for data in (b'1', b'2'):
+            client.sendall(data)
+            server._read(sock)
+        client.close()
+        server._read(sock)
+
+        # A read held back for the next flush stays ahead of the disconnect
+        m.setFairScheduling(budget=1)
+        while len(m):
+            m.flush()
+        assert app.received == [(sock, b'1'), (sock, b'2'), (sock, None)]
+    finally:
+        client.close()
+        server._close(server._sock)
@@ -8,7 +8,7 @@ from ssl import CERT_NONE, PROTOCOL_TLS_CLIENT, SSLContext
 import pytest
 
 from circuits import Debugger, Manager
-from circuits.core.pollers import EPoll, KQueue, Poll, Select
+from circuits.core.pollers import AsyncioPoller, EPoll, KQueue, Poll, Select
 from circuits.net.events import close, connect, write
 from circuits.net.sockets import TCP6Client, TCP6Server, TCPClient, TCPServer
 from tests.conftest import WaitEvent
@@ -92,6 +92,8 @@ def pytest_generate_tests(metafunc):
         if hasattr(select, 'kqueue'):
             poller.append((KQueue, ipv6))
 
+        poller.append((AsyncioPoller, ipv6))
+
     metafunc.parametrize('Poller,ipv6', poller)
 
 
@@ -268,6 +270,50 @@ def test_tcp_connect_closed_port(Poller, ipv6):
         m.stop()
 
 
+def test_tcp_connect_pending(Poller, ipv6):
+    if pytest.PLATFORM == 'win32':
+        pytest.skip('Broken on Windows')
+
+    m = Manager() + Poller() + Debugger()
+
+    # A listening socket with a full backlog leaves new connections pending
+    listener = socket(AF_INET6 if ipv6 else AF_INET, SOCK_STREAM)
+    listener.bind(('::1' if ipv6 else '127.0.0.1', 0))
+    listener.listen(0)
+    host, port = listener.getsockname()[:2]
+    filler = socket(AF_INET6 if ipv6 else AF_INET, SOCK_STREAM)
+    filler.connect((host, port))
+
+    if ipv6:
+        tcp_client = TCP6Client(connect_timeout=5)
+    else:
+        tcp_client = TCPClient(connect_timeout=5)
+    client = Client() + tcp_client
+    client.register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(client, 'ready')
+
+        client.fire(connect(host, port))
+        assert pytest.wait_for(tcp_client, '_sock', lambda obj, attr: obj._poller.isWriting(obj._sock))
+
+        # The connect task is suspended, not polled every tick
+        assert not m._tasks
+        assert not client.connected
+
+        # Make room in the backlog, the connection is made on the next SYN
+        listener.accept()[0].close()
+
+        assert pytest.wait_for(client, 'connected')
+    finally:
+        client.unregister()
+        m.stop()
+        filler.close()
+        listener.close()
+
+
 def test_tcp_bind(Poller, ipv6):
     m = Manager() + Poller()
 
@@ -5,7 +5,7 @@ import socket
 import pytest
 
 from circuits import Manager
-from circuits.core.pollers import EPoll, KQueue, Poll, Select
+from circuits.core.pollers import AsyncioPoller, EPoll, KQueue, Poll, Select
 from circuits.net.events import close, write
 from circuits.net.sockets import UDP6Client, UDP6Server, UDPClient, UDPServer
 
@@ -37,6 +37,8 @@ def pytest_generate_tests(metafunc):
         if hasattr(select, 'kqueue'):
             poller.append((KQueue, ipv6))
 
+        poller.append((AsyncioPoller, ipv6))
+
     metafunc.parametrize('Poller,ipv6', poller)
 
 
@@ -8,7 +8,7 @@ import pytest
 from pytest import fixture
 
 from circuits import Manager
-from circuits.core.pollers import EPoll, KQueue, Poll, Select
+from circuits.core.pollers import AsyncioPoller, EPoll, KQueue, Poll, Select
 from circuits.net.sockets import UNIXClient, UNIXServer, close, connect, write
 
 from .client import Client
@@ -36,6 +36,8 @@ def pytest_generate_tests(metafunc):
 
     if hasattr(select, 'kqueue'):
         poller.append(KQueue)
+
+    poller.append(AsyncioPoller)
     metafunc.parametrize('Poller', poller)
 
 
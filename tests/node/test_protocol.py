@@ -18,6 +18,14 @@ class firewall_block(Event):
     pass
 
 
+class send_remote(Event):
+    pass
+
+
+class receive(Event):
+    pass
+
+
 class AppClient(Component):
     write_data = b''
 
@@ -27,6 +35,12 @@ class AppClient(Component):
     def write(self, data):
         self.write_data = data
 
+    def send_remote(self, remote_event):
+        return self.protocol.send(remote_event)
+
+    def receive(self, data):
+        self.protocol.add_buffer(data)
+
 
 class AppFirewall(Component):
     write_data = b''
@@ -200,6 +214,25 @@ def test_send(app_client, watcher):
     assert next(generator).getValue() == value.value
 
 
+def test_send_task(app_client, manager, watcher):
+    event = return_value()
+    result = app_client.fire(send_remote(event))
+
+    assert watcher.wait('write')
+    assert app_client.write_data == str.encode(dump_event(event, 0) + '~~~')
+
+    # The task waits for the result without being polled
+    assert not manager._tasks
+
+    value = Value()
+    value.value = 'Hello server!'
+    value.errors = False
+    value.node_call_id = 0
+    app_client.fire(receive(str.encode(dump_value(value) + '~~~')))
+
+    assert pytest.wait_for(result, 'value', value.value)
+
+
 def test_send_server(app_server, watcher):
     event = return_value()
     generator = app_server.protocol.send(event)
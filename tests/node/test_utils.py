@@ -6,7 +6,7 @@ test_utils
 
 import json
 
-from circuits import Event
+from circuits import Event, LightEvent
 from circuits.core import Value
 from circuits.node.utils import dump_event, dump_value, load_event, load_value
 
@@ -15,6 +15,12 @@ class test(Event):
     """test Event"""
 
 
+class light(LightEvent):
+    """light Event"""
+
+    __slots__ = ()
+
+
 def test_events():
     event = test(1, 2, 3, foo='bar')
     event.success = True
@@ -61,3 +67,16 @@ def test_values():
     assert meta['test_meta'] == event.test_meta
     assert meta['_test_meta'] == event._test_meta
     assert '__test_meta' not in meta
+
+
+def test_light_events():
+    event = light(1, 2, 3)
+
+    faked = json.loads(dump_event(event, 1))
+    assert faked['meta'] == {}
+
+    event, id = load_event(json.dumps(faked))
+    assert event.name == 'light'
+    assert event.args == [1, 2, 3]
+    assert event.kwargs == {}
+    assert id == 1
@@ -6,8 +6,8 @@ Test all functionality of the tools package.
 
 import pytest
 
-from circuits import Component, reprhandler
-from circuits.tools import findroot, inspect, kill, tryimport
+from circuits import Component, Event, reprhandler
+from circuits.tools import findroot, inspect, kill, stats, tryimport
 
 
 class A(Component):
@@ -149,3 +149,16 @@ def test_tryimport_obj():
 def test_tryimport_fail():
     m = tryimport('asdf')
     assert m is None
+
+
+def test_stats():
+    a = A()
+    assert 'disabled' in stats(a)
+
+    a.setInstrumentation()
+    a.fire(Event.create('foo'))
+    a.flush()
+
+    s = stats(a)
+    assert 'foo: A.foo' in s
+    assert 'Queue Wait: 1' in s